@@ -1,16 +1,63 @@
-from flask import Flask, render_template, request, redirect, url_for, send_file
+from flask import Flask, render_template, request, redirect, url_for, jsonify
 import os
+import time
+import uuid
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from werkzeug.utils import secure_filename
 import main as resume_processor
 
 app = Flask(__name__)
-app.config['UPLOAD_FOLDER'] = 'resumes'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['MAX_RESUME_PAGES'] = 50  # Longer PDFs are only analyzed up to this page
+app.config['JOB_WORKERS'] = os.cpu_count() or 1  # Uploads analyzed in parallel
+app.config['JOB_TTL'] = 60 * 60  # Seconds a finished job's report is kept
 ALLOWED_EXTENSIONS = {'pdf', 'docx'}
 
+# Background jobs by id. Uploads are analyzed in memory and each job keeps
+# its own report, so concurrent uploads never see each other's files and
+# nothing is written to the app's filesystem.
+jobs = {}
+jobs_lock = threading.Lock()
+executor = None
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def get_executor():
+    """Worker pool for analysis jobs, started on first use"""
+    global executor
+    with jobs_lock:
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=app.config['JOB_WORKERS'])
+        return executor
+
+def run_job(uploads, max_pages):
+    """Analyze the (filename, bytes) uploads of one job and return the HTML report"""
+    cache = resume_processor.open_cache()
+    results_dict = {}
+    for filename, data in uploads:
+        processed = resume_processor.process_document(data, filename, cache, max_pages)
+        if processed:
+            result, score = processed
+            results_dict[result['Name']] = result
+    return resume_processor.generate_html_report(results_dict)
+
+def job_state(job):
+    future = job['future']
+    if not future.done():
+        return 'running' if future.running() else 'queued'
+    return 'failed' if future.exception() else 'done'
+
+def purge_jobs():
+    """Forget finished jobs older than JOB_TTL"""
+    cutoff = time.time() - app.config['JOB_TTL']
+    with jobs_lock:
+        expired = [job_id for job_id, job in jobs.items()
+                   if job['future'].done() and job['created'] < cutoff]
+        for job_id in expired:
+            del jobs[job_id]
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -19,30 +66,52 @@ def index():
 def upload_file():
     if 'files[]' not in request.files:
         return redirect(request.url)
-    
+
     files = request.files.getlist('files[]')
-    
-    # Clear the resumes directory
-    for filename in os.listdir(app.config['UPLOAD_FOLDER']):
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        try:
-            if os.path.isfile(file_path):
-                os.unlink(file_path)
-        except Exception as e:
-            print(f'Error: {e}')
-    
-    # Save new files
-    for file in files:
-        if file and allowed_file(file.filename):
-            filename = secure_filename(file.filename)
-            file.save(os.path.join(app.config['UPLOAD_FOLDER'], filename))
-    
-    # Process resumes
-    resume_processor.main()
-    
+    purge_jobs()
+
+    # Read the files straight from the request stream
+    uploads = [(secure_filename(file.filename), file.read())
+               for file in files if file and allowed_file(file.filename)]
+
+    # Queue the analysis and answer straight away
+    job_id = uuid.uuid4().hex
+    future = get_executor().submit(run_job, uploads, app.config['MAX_RESUME_PAGES'])
+    with jobs_lock:
+        jobs[job_id] = {'future': future, 'created': time.time()}
+
+    return jsonify({
+        'job_id': job_id,
+        'status_url': url_for('job_status', job_id=job_id),
+        'report_url': url_for('job_report', job_id=job_id),
+    }), 202
+
+@app.route('/jobs/<job_id>')
+def job_status(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+
+    status = {'job_id': job_id, 'state': job_state(job)}
+    if status['state'] == 'failed':
+        status['error'] = str(job['future'].exception())
+    return jsonify(status)
+
+@app.route('/jobs/<job_id>/report')
+def job_report(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+
+    state = job_state(job)
+    if state == 'failed':
+        return jsonify({'job_id': job_id, 'state': state,
+                        'error': str(job['future'].exception())}), 500
+    if state != 'done':
+        return jsonify({'job_id': job_id, 'state': state}), 202
+
     # Return the generated report
-    return send_file('resume_report.html')
+    return job['future'].result()
 
 if __name__ == '__main__':
-    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
     app.run(debug=True, port=5001)
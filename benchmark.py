@@ -0,0 +1,323 @@
+"""Benchmark the extraction, analysis, scoring and report stages.
+
+Synthesizes Swedish and English home care CVs of several page counts as PDF
+(with create_pdfs.convert_txt_to_pdf) and DOCX, then times every stage
+separately and reports p50/p95 latency, throughput and peak memory.
+
+    python benchmark.py                              # print a table
+    python benchmark.py --json bench.json            # also save the results
+    python benchmark.py --compare bench.json         # compare with a saved run
+    python benchmark.py --segmenters                 # sentence segmenters vs Punkt
+"""
+import os
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+
+import main as resume_processor
+import report
+import scoring
+
+# Page counts of the synthesized CVs
+SIZES = [1, 3, 10, 50]
+
+# Lines that fit on one page as convert_txt_to_pdf lays them out
+LINES_PER_PAGE = 22
+
+HEADINGS = {
+    'sv': ['ARBETSLIVSERFARENHET', 'UTBILDNING', 'KOMPETENSER', 'SPRÅK'],
+    'en': ['WORK EXPERIENCE', 'EDUCATION', 'SKILLS', 'LANGUAGES'],
+}
+
+LINES = {
+    'sv': [
+        "Jag arbetade som vårdbiträde inom hemtjänst i Stockholm {year}-{end}.",
+        "Ansvarig för medicinhantering, sårvård och dokumentation i Treserva.",
+        "Utbildning inom vård och omsorg på Komvux, examen {year}.",
+        "Kurs i första hjälpen och förflyttningsteknik, {year}.",
+        "Hjälpte brukare med personlig hygien, dusch, påklädning och matlagning.",
+        "Erfarenhet av social aktivitet och ett respektfullt bemötande av äldre.",
+        "Språk: svenska (modersmål), engelska, arabiska.",
+        "Anställd på äldreboende som undersköterska sedan {year}.",
+        "Jag är flexibel, lyhörd och har stort tålamod.",
+        "Städning, tvätt och inköp åt brukare i ordinärt boende.",
+        "På fritiden tycker jag om att promenera i naturen och läsa böcker.",
+        "Referenser lämnas på begäran.",
+    ],
+    'en': [
+        "I worked as a caregiver in home care in Gothenburg from {year} to {end}.",
+        "Responsible for medication, wound care and documentation in Procapita.",
+        "Completed a nursing assistant programme in elderly care in {year}.",
+        "Certified in first aid and patient handling, {year}.",
+        "Assisted clients with personal care, showering, dressing and cooking.",
+        "Experienced in social activities and communication with seniors.",
+        "Languages: English (native), Swedish, Spanish.",
+        "Employed at a nursing home as a care assistant since {year}.",
+        "I am flexible, patient and a good listener.",
+        "Holds a diploma in healthcare and a driving license.",
+        "In my spare time I enjoy hiking and reading.",
+        "References available on request.",
+    ],
+}
+
+def synthesize_text(pages, language, seed=0):
+    """Plain text CV of roughly the given number of pages"""
+    rng = random.Random(seed * 1000 + pages)
+    lines = []
+    for i in range(pages * LINES_PER_PAGE):
+        if i % 8 == 0:
+            lines.append(HEADINGS[language][(i // 8) % len(HEADINGS[language])])
+            continue
+        year = rng.randint(1995, 2023)
+        lines.append(rng.choice(LINES[language]).format(year=year, end=year + rng.randint(1, 5)))
+    return '\n'.join(lines)
+
+def write_docx(text, file_path):
+    from docx import Document
+    doc = Document()
+    for line in text.split('\n'):
+        doc.add_paragraph(line)
+    doc.save(file_path)
+
+def build_corpus(folder, sizes):
+    """Write a PDF and a DOCX CV per size and language; returns their descriptions"""
+    from create_pdfs import convert_txt_to_pdf
+    corpus = []
+    for pages in sizes:
+        for language in LINES:
+            name = f'cv_{language}_{pages}p'
+            text = synthesize_text(pages, language)
+            txt_path = os.path.join(folder, name + '.txt')
+            with open(txt_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            pdf_path = os.path.join(folder, name + '.pdf')
+            docx_path = os.path.join(folder, name + '.docx')
+            convert_txt_to_pdf(txt_path, pdf_path)
+            write_docx(text, docx_path)
+            corpus.append({'name': name, 'pages': pages, 'pdf': pdf_path, 'docx': docx_path})
+    return corpus
+
+def time_calls(fn, repeat):
+    """Wall time of repeat calls of fn"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+def peak_memory(fn):
+    """Peak bytes allocated by Python during one call of fn"""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+def summarize(samples, peaks):
+    return {
+        'runs': len(samples),
+        'p50_ms': percentile(samples, 0.50) * 1000,
+        'p95_ms': percentile(samples, 0.95) * 1000,
+        'per_second': len(samples) / sum(samples) if sum(samples) else float('inf'),
+        'peak_kib': max(peaks) / 1024,
+    }
+
+def document_stages(doc):
+    """(stage name, callable) pairs for one corpus document"""
+    segment = resume_processor.SEGMENTERS[resume_processor.DEFAULT_SEGMENTER]
+    text = resume_processor.extract_text_from_pdf(doc['pdf'])
+    sentences = segment(text)
+    analysis = resume_processor.analyze_resume(text)
+    return [
+        ('extract_text_from_pdf', lambda: resume_processor.extract_text_from_pdf(doc['pdf'])),
+        ('extract_text_from_docx', lambda: resume_processor.extract_text_from_docx(doc['docx'])),
+        ('segment', lambda: segment(text)),
+        ('analyze_resume', lambda: resume_processor.analyze_resume(text)),
+        ('extract_skills', lambda: resume_processor.extract_skills(text)),
+        ('extract_education', lambda: resume_processor.extract_education(sentences)),
+        ('extract_experience', lambda: resume_processor.extract_experience(sentences)),
+        ('extract_languages', lambda: resume_processor.extract_languages(text)),
+        ('extract_certifications', lambda: resume_processor.extract_certifications(sentences)),
+        ('calculate_score', lambda: resume_processor.calculate_score(analysis)),
+    ], analysis
+
+def run(corpus, repeat, report_candidates):
+    """Time every stage; returns {stage: {'<pages>p': summary}}"""
+    samples = {}
+    peaks = {}
+    analyses = {}
+    for doc in corpus:
+        stages, analysis = document_stages(doc)
+        analyses.setdefault(doc['pages'], []).append(analysis)
+        for stage, fn in stages:
+            key = (stage, doc['pages'])
+            fn()  # Warm up
+            samples.setdefault(key, []).extend(time_calls(fn, repeat))
+            peaks.setdefault(key, []).append(peak_memory(fn))
+
+    # One report per size with report_candidates cards of that size
+    for pages, size_analyses in analyses.items():
+        results_dict = {f'Candidate {i}': size_analyses[i % len(size_analyses)]
+                        for i in range(report_candidates)}
+        fn = lambda: resume_processor.generate_html_report(results_dict)
+        key = ('generate_html_report', pages)
+        fn()  # Warm up
+        samples[key] = time_calls(fn, repeat)
+        peaks[key] = [peak_memory(fn)]
+
+        # Rescoring every candidate of the report at once
+        counts = scoring.count_matrix(list(results_dict.values()))
+        fn = lambda: scoring.score_counts(counts)
+        key = ('score_counts', pages)
+        fn()  # Warm up
+        samples[key] = time_calls(fn, repeat)
+        peaks[key] = [peak_memory(fn)]
+
+        # A single card, the unit ReportWriter streams to disk
+        fn = lambda: report.render_candidate('Candidate 0', size_analyses[0])
+        key = ('render_candidate', pages)
+        fn()  # Warm up
+        samples[key] = time_calls(fn, repeat)
+        peaks[key] = [peak_memory(fn)]
+
+    results = {}
+    for (stage, pages), stage_samples in samples.items():
+        results.setdefault(stage, {})[f'{pages}p'] = summarize(stage_samples, peaks[(stage, pages)])
+    return results
+
+def compare_segmenters(folder, repeat):
+    """Speed of every segmenter on a folder of real CVs, and its extraction parity with Punkt
+
+    Returns {'speed': {segmenter: summary}, 'parity': {segmenter: stats}}.
+    Parity is the share of files whose skills, languages and score match the
+    Punkt analysis, and the mean difference in sentences found per section.
+    """
+    texts = [resume_processor.extract_text(file_path)
+             for file_path in resume_processor.list_resumes(folder)
+             if resume_processor.verify_document(file_path)]
+    speed = {}
+    analyses = {}
+    for name, segment in resume_processor.SEGMENTERS.items():
+        try:
+            segment(texts[0])
+        except LookupError:
+            print(f"Skipping {name}: its NLTK data is not installed")
+            continue
+        samples = []
+        peaks = []
+        for text in texts:
+            samples.extend(time_calls(lambda: segment(text), repeat))
+            peaks.append(peak_memory(lambda: segment(text)))
+        speed[name] = summarize(samples, peaks)
+        analyses[name] = [resume_processor.analyze_resume(text, segmenter=name) for text in texts]
+
+    parity = {}
+    reference = analyses.get('punkt')
+    for name, segmenter_analyses in analyses.items():
+        if reference is None or name == 'punkt':
+            continue
+        pairs = list(zip(segmenter_analyses, reference))
+        stats = {
+            f'same_{section}': sum(set(a[section]) == set(b[section]) for a, b in pairs) / len(pairs)
+            for section in ('skills', 'languages')
+        }
+        stats['same_score'] = sum(resume_processor.calculate_score(a) == resume_processor.calculate_score(b)
+                                  for a, b in pairs) / len(pairs)
+        for section in resume_processor.SECTION_TAGS:
+            stats[f'{section}_count_diff'] = statistics.mean(len(a[section]) - len(b[section])
+                                                            for a, b in pairs)
+        parity[name] = stats
+    return {'files': len(texts), 'speed': speed, 'parity': parity}
+
+def print_segmenters(comparison):
+    print(f"{'segmenter':<12}{'p50 ms':>11}{'p95 ms':>11}{'docs/s':>11}{'peak KiB':>11}")
+    for name, s in comparison['speed'].items():
+        print(f"{name:<12}{s['p50_ms']:>11.3f}{s['p95_ms']:>11.3f}{s['per_second']:>11.1f}{s['peak_kib']:>11.1f}")
+    for name, stats in comparison['parity'].items():
+        print(f"\n{name} vs punkt over {comparison['files']} files:")
+        for stat, value in stats.items():
+            print(f"  {stat:<28}{value:>8.2f}")
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_table(results):
+    print(f"{'stage':<24}{'size':>6}{'p50 ms':>11}{'p95 ms':>11}{'ops/s':>11}{'peak KiB':>11}")
+    for stage, sizes in results.items():
+        for size, s in sizes.items():
+            print(f"{stage:<24}{size:>6}{s['p50_ms']:>11.3f}{s['p95_ms']:>11.3f}"
+                  f"{s['per_second']:>11.1f}{s['peak_kib']:>11.1f}")
+
+def print_comparison(results, baseline, threshold=0.10):
+    """p50 of every stage against a previous run; flags changes beyond threshold"""
+    print(f"\nCompared with {baseline['meta'].get('revision') or 'baseline'} (p50, current / baseline):")
+    for stage, sizes in results.items():
+        for size, s in sizes.items():
+            previous = baseline['stages'].get(stage, {}).get(size)
+            if not previous or not previous['p50_ms']:
+                continue
+            ratio = s['p50_ms'] / previous['p50_ms']
+            flag = 'slower' if ratio > 1 + threshold else 'faster' if ratio < 1 - threshold else ''
+            print(f"{stage:<24}{size:>6}{ratio:>9.2f}x  {flag}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the resume analysis stages")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help="CV page counts")
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per stage and document")
+    parser.add_argument('--report-candidates', type=int, default=100,
+                        help="candidates in each timed HTML report")
+    parser.add_argument('--json', help="write results to this file")
+    parser.add_argument('--compare', help="results file of an earlier run to compare against")
+    parser.add_argument('--segmenters', nargs='?', const='resumes_backup', metavar='FOLDER',
+                        help="instead compare the sentence segmenters on the CVs in FOLDER "
+                             "(default: %(const)s)")
+    args = parser.parse_args()
+
+    if args.segmenters:
+        comparison = compare_segmenters(args.segmenters, args.repeat)
+        print_segmenters(comparison)
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump({'meta': {'revision': git_revision()}, 'segmenters': comparison}, f, indent=2)
+        return
+
+    with tempfile.TemporaryDirectory() as folder:
+        corpus = build_corpus(folder, args.sizes)
+        results = run(corpus, args.repeat, args.report_candidates)
+
+    print_table(results)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            print_comparison(results, json.load(f))
+    if args.json:
+        output = {
+            'meta': {
+                'revision': git_revision(),
+                'python': platform.python_version(),
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'repeat': args.repeat,
+                'sizes': args.sizes,
+            },
+            'stages': results,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Measure how long `import main` takes in a fresh interpreter.
+
+    python benchmark_import.py                 # current tree
+    python benchmark_import.py --ref baseline  # also a git revision, for comparison
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+# Modules that should not be loaded just by importing main
+HEAVY_MODULES = ['nltk', 'pandas', 'numpy', 'pyarrow', 'matplotlib', 'seaborn', 'PyPDF2', 'docx', 'smtplib', 'jinja2']
+
+PROBE = '''
+import sys, time, json
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+print(json.dumps({'seconds': elapsed,
+                  'loaded': [m for m in %r if m in sys.modules]}))
+''' % HEAVY_MODULES
+
+def measure(tree, runs):
+    """Import main from tree in runs fresh interpreters"""
+    samples = []
+    loaded = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', PROBE], cwd=tree,
+                                capture_output=True, text=True, check=True).stdout
+        probe = json.loads(output.strip().splitlines()[-1])
+        samples.append(probe['seconds'])
+        loaded = probe['loaded']
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'loaded': loaded,
+    }
+
+def export_revision(ref, folder):
+    """Check out a git revision's files into folder"""
+    archive = subprocess.run(['git', 'archive', ref], capture_output=True, check=True).stdout
+    subprocess.run(['tar', '-x', '-C', folder], input=archive, check=True)
+
+def report(label, stats):
+    print(f"{label:<10} min {stats['min'] * 1000:8.1f} ms   median {stats['median'] * 1000:8.1f} ms"
+          f"   heavy modules loaded: {', '.join(stats['loaded']) or 'none'}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the import time of main.py")
+    parser.add_argument('--runs', type=int, default=5, help="interpreter launches per tree")
+    parser.add_argument('--ref', help="git revision to compare against")
+    args = parser.parse_args()
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    current = measure(here, args.runs)
+    report('current', current)
+    if args.ref:
+        with tempfile.TemporaryDirectory() as folder:
+            export_revision(args.ref, folder)
+            previous = measure(folder, args.runs)
+        report(args.ref, previous)
+        print(f"speedup    {previous['median'] / current['median']:.1f}x")
+
+if __name__ == "__main__":
+    main()
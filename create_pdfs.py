@@ -46,14 +46,15 @@ def convert_txt_to_pdf(txt_file, pdf_file):
     # Build PDF
     doc.build(story)
 
-# Convert all txt files in resumes folder
-resumes_dir = 'resumes'
-for filename in os.listdir(resumes_dir):
-    if filename.endswith('.txt'):
-        txt_path = os.path.join(resumes_dir, filename)
-        pdf_path = os.path.join(resumes_dir, filename.replace('.txt', '.pdf'))
-        convert_txt_to_pdf(txt_path, pdf_path)
-        # Remove the txt file after conversion
-        os.remove(txt_path)
+if __name__ == "__main__":
+    # Convert all txt files in resumes folder
+    resumes_dir = 'resumes'
+    for filename in os.listdir(resumes_dir):
+        if filename.endswith('.txt'):
+            txt_path = os.path.join(resumes_dir, filename)
+            pdf_path = os.path.join(resumes_dir, filename.replace('.txt', '.pdf'))
+            convert_txt_to_pdf(txt_path, pdf_path)
+            # Remove the txt file after conversion
+            os.remove(txt_path)
 
-print("PDF conversion completed!")
+    print("PDF conversion completed!")
@@ -0,0 +1,124 @@
+import os
+import tempfile
+
+from scoring import score_counts
+
+# numpy is only imported when features are saved, loaded or scored
+
+# Default feature store location, next to the result tables
+FEATURES_FILE = "cv_features.npz"
+
+# Sections whose items are keywords, stored as keyword ids
+KEYWORD_SECTIONS = ('skills', 'languages')
+
+class FeatureWriter:
+    """Collects a compact feature vector per candidate and saves them as one .npz file
+
+    A candidate's features are its item count per analysis section plus the
+    ids of the keywords it matched, which is all a scoring profile needs, so
+    rescoring never has to go back to the documents. Keyword ids index the
+    stored keywords vocabulary, which should hold the keywords of
+    KEYWORD_SECTIONS.
+    """
+
+    def __init__(self, path, sections, keywords):
+        self.path = path
+        self.sections = tuple(sections)
+        self.keywords = tuple(keywords)
+        self._keyword_ids = {keyword: i for i, keyword in enumerate(self.keywords)}
+        self.names = []
+        self.counts = []
+        self.keyword_ids = []
+        self.offsets = [0]
+
+    def add(self, result):
+        self.names.append(result['Name'])
+        self.counts.append([len(result.get(section, ())) for section in self.sections])
+        self.keyword_ids.extend(self._keyword_ids[keyword]
+                                for section in KEYWORD_SECTIONS
+                                for keyword in result.get(section, ())
+                                if keyword in self._keyword_ids)
+        self.offsets.append(len(self.keyword_ids))
+
+    def collect(self, processed):
+        """Pass (result, score) pairs through, adding each result on the way"""
+        for result, score in processed:
+            self.add(result)
+            yield result, score
+
+    def close(self):
+        """Write the store atomically"""
+        import numpy as np
+        folder = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=folder, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.savez_compressed(
+                f,
+                names=np.array(self.names, dtype=str),
+                sections=np.array(self.sections, dtype=str),
+                keywords=np.array(self.keywords, dtype=str),
+                counts=np.array(self.counts, dtype=np.int32).reshape(-1, len(self.sections)),
+                keyword_ids=np.array(self.keyword_ids, dtype=np.int32),
+                offsets=np.array(self.offsets, dtype=np.int64),
+            )
+        os.replace(tmp_path, self.path)
+
+class Features:
+    """Feature vectors loaded back from a store written by FeatureWriter"""
+
+    def __init__(self, names, sections, keywords, counts, keyword_ids, offsets):
+        self.names = names
+        self.sections = sections
+        self.keywords = keywords
+        self.counts = counts
+        self.keyword_ids = keyword_ids
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.names)
+
+    def section_counts(self, sections):
+        """Count matrix with one column per section, in the given order"""
+        missing = [section for section in sections if section not in self.sections]
+        if missing:
+            raise ValueError(f"No stored counts for sections: {', '.join(missing)}")
+        return self.counts[:, [self.sections.index(section) for section in sections]]
+
+    def keyword_points(self, points):
+        """Sum of points over each candidate's matched keywords"""
+        import numpy as np
+        # Only keywords of KEYWORD_SECTIONS are stored, any other would never score
+        unknown = [keyword for keyword in points if keyword not in self.keywords]
+        if unknown:
+            raise ValueError(f"Not a {' or '.join(KEYWORD_SECTIONS)} keyword: "
+                             f"{', '.join(unknown)}")
+        points_by_id = np.zeros(len(self.keywords))
+        for keyword, value in points.items():
+            points_by_id[self.keywords.index(keyword)] = value
+        rows = np.repeat(np.arange(len(self)), np.diff(self.offsets))
+        return np.bincount(rows, weights=points_by_id[self.keyword_ids], minlength=len(self))
+
+def load_features(path=FEATURES_FILE):
+    import numpy as np
+    with np.load(path) as data:
+        return Features(data['names'].tolist(), data['sections'].tolist(),
+                        data['keywords'].tolist(), data['counts'], data['keyword_ids'],
+                        data['offsets'])
+
+def rescore(features, profile):
+    """Score stored features under a profile from scoring.load_profiles
+
+    Returns (totals, breakdown, columns): breakdown has one column per
+    section of the profile's rules, plus a 'keywords' column when the
+    profile awards points for keywords.
+    """
+    import numpy as np
+    rules = profile['rules']
+    totals, breakdown = score_counts(features.section_counts(list(rules)), rules)
+    columns = list(rules)
+    if profile.get('keywords'):
+        bonus = features.keyword_points(profile['keywords'])
+        totals = totals + bonus
+        breakdown = np.column_stack([breakdown, bonus])
+        columns.append('keywords')
+    return totals, breakdown, columns
@@ -1,10 +1,15 @@
 import tkinter as tk
 from tkinter import ttk, filedialog
 import os
+import queue
 import shutil
+import threading
 import main as resume_processor
 import webbrowser
 
+# How often the window checks for progress from the analysis, in ms
+POLL_INTERVAL = 100
+
 class ResumeAnalyzerGUI:
     def __init__(self, root):
         self.root = root
@@ -12,7 +17,7 @@ class ResumeAnalyzerGUI:
         
         # Set window size and position
         window_width = 600
-        window_height = 400
+        window_height = 460
         screen_width = root.winfo_screenwidth()
         screen_height = root.winfo_screenheight()
         center_x = int(screen_width/2 - window_width/2)
@@ -52,16 +57,33 @@ class ResumeAnalyzerGUI:
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(column=0, row=3, columnspan=2, pady=20)
         
-        ttk.Button(button_frame, text="Select Files", command=self.select_files).grid(column=0, row=0, padx=5)
-        ttk.Button(button_frame, text="Clear Files", command=self.clear_files).grid(column=1, row=0, padx=5)
-        ttk.Button(button_frame, text="Analyze Resumes", command=self.analyze_resumes).grid(column=2, row=0, padx=5)
+        self.select_button = ttk.Button(button_frame, text="Select Files", command=self.select_files)
+        self.select_button.grid(column=0, row=0, padx=5)
+        self.clear_button = ttk.Button(button_frame, text="Clear Files", command=self.clear_files)
+        self.clear_button.grid(column=1, row=0, padx=5)
+        self.analyze_button = ttk.Button(button_frame, text="Analyze Resumes", command=self.analyze_resumes)
+        self.analyze_button.grid(column=2, row=0, padx=5)
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self.cancel_analysis,
+                                        state=tk.DISABLED)
+        self.cancel_button.grid(column=3, row=0, padx=5)
+        
+        # Progress bar
+        self.progress = ttk.Progressbar(main_frame, mode='determinate')
+        self.progress.grid(column=0, row=4, columnspan=2, sticky=(tk.W, tk.E), padx=5)
         
         # Status label
         self.status_var = tk.StringVar()
         self.status_label = ttk.Label(main_frame, textvariable=self.status_var, wraplength=500)
-        self.status_label.grid(column=0, row=4, columnspan=2, pady=10)
+        self.status_label.grid(column=0, row=5, columnspan=2, pady=10)
         
         self.selected_files = []
+        self.file_rows = {}
+        
+        # The analysis runs on a worker thread, which reports back through
+        # this queue; only the Tk thread touches the widgets
+        self.messages = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.worker = None
 
     def select_files(self):
         files = filedialog.askopenfilenames(
@@ -95,23 +117,91 @@ class ResumeAnalyzerGUI:
         self.file_listbox.delete(0, tk.END)
         self.status_var.set("All files cleared")
 
+    def set_file_status(self, filename, status):
+        """Show a file's status next to its name in the listbox"""
+        index = self.file_rows.get(filename)
+        if index is not None:
+            self.file_listbox.delete(index)
+            self.file_listbox.insert(index, f"{filename} — {status}")
+
+    def set_running(self, running):
+        state = tk.DISABLED if running else tk.NORMAL
+        for button in (self.select_button, self.clear_button, self.analyze_button):
+            button.configure(state=state)
+        self.cancel_button.configure(state=tk.NORMAL if running else tk.DISABLED)
+
     def analyze_resumes(self):
         if not self.selected_files:
             self.status_var.set("Please select some resume files first")
             return
         
+        filenames = [os.path.basename(file) for file in self.selected_files]
+        self.file_rows = {filename: index for index, filename in enumerate(filenames)}
+        for filename in filenames:
+            self.set_file_status(filename, "waiting")
+        self.progress.configure(maximum=len(filenames), value=0)
+        self.status_var.set("Analyzing resumes...")
+        self.set_running(True)
+        
+        self.cancel_event.clear()
+        self.worker = threading.Thread(target=self.run_analysis, daemon=True)
+        self.worker.start()
+        self.root.after(POLL_INTERVAL, self.poll_messages)
+
+    def run_analysis(self):
+        """Worker thread: run the batch and report progress through the queue"""
+        def progress(file_path, processed):
+            score = processed[1]['total'] if processed else None
+            self.messages.put(('file', os.path.basename(file_path), score))
+        
         try:
-            self.status_var.set("Analyzing resumes...")
-            self.root.update()
-            
-            resume_processor.main()
-            
-            report_path = os.path.abspath('resume_report.html')
-            webbrowser.open('file://' + report_path)
-            
-            self.status_var.set("Analysis complete! Opening report in your browser.")
+            count = resume_processor.main(workers=os.cpu_count() or 1, progress=progress,
+                                          cancel=self.cancel_event)
+            self.messages.put(('cancelled' if self.cancel_event.is_set() else 'done', count))
         except Exception as e:
-            self.status_var.set(f"Error during analysis: {str(e)}")
+            self.messages.put(('error', str(e)))
+
+    def cancel_analysis(self):
+        self.cancel_event.set()
+        self.cancel_button.configure(state=tk.DISABLED)
+        self.status_var.set("Cancelling after the files in progress...")
+
+    def poll_messages(self):
+        """Apply the worker's progress to the window; runs on the Tk thread"""
+        while True:
+            try:
+                message = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            
+            kind = message[0]
+            if kind == 'file':
+                _, filename, score = message
+                self.set_file_status(filename, f"score {score}" if score is not None else "failed")
+                done = int(self.progress['value']) + 1
+                self.progress.configure(value=done)
+                if not self.cancel_event.is_set():
+                    self.status_var.set(f"Analyzed {done} of {len(self.file_rows)} resumes...")
+            elif kind == 'done':
+                self.set_running(False)
+                report_path = os.path.abspath('resume_report.html')
+                webbrowser.open('file://' + report_path)
+                self.status_var.set("Analysis complete! Opening report in your browser.")
+                return
+            elif kind == 'cancelled':
+                self.set_running(False)
+                for filename, index in self.file_rows.items():
+                    if self.file_listbox.get(index).endswith("waiting"):
+                        self.set_file_status(filename, "cancelled")
+                self.status_var.set(f"Cancelled; the report covers the {message[1]} resumes "
+                                    f"analyzed so far.")
+                return
+            else:
+                self.set_running(False)
+                self.status_var.set(f"Error during analysis: {message[1]}")
+                return
+        
+        self.root.after(POLL_INTERVAL, self.poll_messages)
 
 def main():
     root = tk.Tk()
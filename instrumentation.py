@@ -0,0 +1,95 @@
+import json
+import time
+from contextlib import nullcontext
+
+class FileMetrics:
+    """Wall and CPU time per pipeline stage plus counters for one file
+
+    Stages entered several times (e.g. once per page) accumulate.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.stages = {}
+        self.counters = {}
+        self._start = (time.perf_counter(), time.process_time())
+
+    def stage(self, name):
+        return _Stage(self, name)
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def as_dict(self):
+        wall_start, cpu_start = self._start
+        return {
+            'file': self.name,
+            'wall': time.perf_counter() - wall_start,
+            'cpu': time.process_time() - cpu_start,
+            'stages': self.stages,
+            'counters': self.counters,
+        }
+
+    def write(self, log_path):
+        """Append this file's metrics to a JSON lines log"""
+        line = json.dumps(self.as_dict(), ensure_ascii=False) + '\n'
+        # One append per record keeps lines from parallel workers intact
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(line)
+
+class _Stage:
+    __slots__ = ('metrics', 'name', 'wall', 'cpu')
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        totals = self.metrics.stages.setdefault(self.name, {'wall': 0.0, 'cpu': 0.0})
+        totals['wall'] += time.perf_counter() - self.wall
+        totals['cpu'] += time.process_time() - self.cpu
+        return False
+
+class NullMetrics:
+    """Stand-in used when instrumentation is off; every call is a no-op"""
+
+    _stage = nullcontext()
+
+    def stage(self, name):
+        return self._stage
+
+    def count(self, name, value=1):
+        pass
+
+NULL_METRICS = NullMetrics()
+
+def read_metrics(log_path):
+    """Records of a JSON lines metrics log"""
+    with open(log_path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def print_summary(records):
+    """Print per-stage totals and counters over all records"""
+    stages = {}
+    counters = {}
+    for record in records:
+        for name, times in record['stages'].items():
+            totals = stages.setdefault(name, {'wall': 0.0, 'cpu': 0.0, 'files': 0})
+            totals['wall'] += times['wall']
+            totals['cpu'] += times['cpu']
+            totals['files'] += 1
+        for name, value in record['counters'].items():
+            counters[name] = counters.get(name, 0) + value
+
+    total_wall = sum(times['wall'] for times in stages.values()) or 1
+    print(f"\n{'stage':<16}{'files':>7}{'wall s':>10}{'cpu s':>10}{'ms/file':>10}{'share':>8}")
+    for name, totals in sorted(stages.items(), key=lambda item: -item[1]['wall']):
+        print(f"{name:<16}{totals['files']:>7}{totals['wall']:>10.3f}{totals['cpu']:>10.3f}"
+              f"{totals['wall'] / totals['files'] * 1000:>10.2f}{totals['wall'] / total_wall:>8.1%}")
+    if counters:
+        print('  '.join(f"{name}={value}" for name, value in sorted(counters.items())))
@@ -0,0 +1,92 @@
+from collections import deque, namedtuple
+
+# A single keyword hit: text[start:end] == keyword
+Match = namedtuple('Match', ['start', 'end', 'keyword'])
+
+class KeywordMatcher:
+    """Aho-Corasick automaton that finds every keyword in a single pass over a text"""
+
+    def __init__(self, groups):
+        # groups maps a group name (e.g. 'skills') to an iterable of keywords.
+        # The same keyword may belong to several groups.
+        self.groups = {}
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                self.groups.setdefault(keyword, set()).add(group)
+
+        # Stable keyword ids in first-seen order
+        self.keywords = tuple(self.groups)
+        self.keyword_ids = {keyword: i for i, keyword in enumerate(self.keywords)}
+        self._build()
+
+    def _build(self):
+        # Trie of all keywords
+        goto = [{}]
+        output = [()]
+        for keyword in self.keywords:
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    output.append(())
+                state = nxt
+            output[state] += (keyword,)
+
+        # Failure links, breadth first
+        fail = [0] * len(goto)
+        order = []
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                output[nxt] += output[fail[nxt]]
+
+        # Fold the failure links into a deterministic transition table so the
+        # scan is one dict lookup per character. Missing entries mean root.
+        delta = [None] * len(goto)
+        delta[0] = dict(goto[0])
+        for state in order:
+            transitions = dict(delta[fail[state]])
+            transitions.update(goto[state])
+            delta[state] = transitions
+
+        self._delta = delta
+        self._output = output
+
+    def find_all(self, text):
+        """Return every (possibly overlapping) keyword occurrence in text"""
+        delta = self._delta
+        output = self._output
+        matches = []
+        state = 0
+        for i, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            if output[state]:
+                end = i + 1
+                for keyword in output[state]:
+                    matches.append(Match(end - len(keyword), end, keyword))
+        return matches
+
+    def keywords_in(self, matches, group):
+        """Distinct keywords of a group among matches, in order of first occurrence"""
+        found = {}
+        for match in matches:
+            if group in self.groups[match.keyword]:
+                found.setdefault(match.keyword, None)
+        return list(found)
+
+    def groups_in(self, matches):
+        """Set of groups hit by matches"""
+        hit = set()
+        for match in matches:
+            hit |= self.groups[match.keyword]
+        return hit
@@ -1,26 +1,65 @@
 import re
 import os
+import io
 import sys
-import nltk
-from docx import Document
-from PyPDF2 import PdfReader
-import pandas as pd
-from datetime import datetime
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
-import webbrowser
-import chardet
-import matplotlib.pyplot as plt
-import seaborn as sns
-from jinja2 import Template
-
-# Initialize NLTK and download required data
-nltk.download('punkt', quiet=True)
-nltk.download('averaged_perceptron_tagger', quiet=True)
-nltk.download('maxent_ne_chunker', quiet=True)
-nltk.download('words', quiet=True)
+import argparse
+import json
+import hashlib
+from bisect import bisect_left, bisect_right
+from functools import partial, lru_cache
+from keyword_matcher import KeywordMatcher
+from result_cache import ResultCache, hash_file, CACHE_FOLDER, DEFAULT_MAX_BYTES
+from manifest import Manifest, MANIFEST_FILE
+from instrumentation import FileMetrics, NULL_METRICS, read_metrics, print_summary
+from results_store import ResultsWriter, FORMATS, CANDIDATES_TABLE
+from report import ReportWriter, render_report, DEFAULT_PAGE_SIZE
+from ranking import top_candidates, rank_candidates
+from scoring import (SCORE_RULES, score_limits, calculate_score, score_dicts, load_profiles,
+                     PROFILES_FILE)
+from features import FeatureWriter, FEATURES_FILE, KEYWORD_SECTIONS, load_features, rescore
+from pipeline import Pipeline, Stage
+
+# nltk, PyPDF2, python-docx, pyarrow and the email modules are imported where
+# they are used: importing this module has to stay cheap for web workers,
+# Streamlit reruns and pool processes that may never need them.
+
+# NLTK data used by the analysis, as (download name, resource path)
+NLTK_RESOURCES = [('punkt', 'tokenizers/punkt')]
+
+# Written once the NLTK resources have been found locally, so later processes
+# skip both the lookup and nltk.download's network round trip
+NLTK_MARKER = os.path.join(CACHE_FOLDER, 'nltk_ready')
+
+_nltk_ready = False
+
+def ensure_nltk_data():
+    """Make sure the NLTK resources are available, downloading them at most once"""
+    global _nltk_ready
+    if _nltk_ready:
+        return
+    marker = ' '.join(name for name, _ in NLTK_RESOURCES)
+    try:
+        with open(NLTK_MARKER, 'r', encoding='utf-8') as f:
+            _nltk_ready = f.read() == marker
+    except OSError:
+        pass
+    if _nltk_ready:
+        return
+    
+    import nltk
+    missing = []
+    for name, resource in NLTK_RESOURCES:
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            # Offline this fails quietly and tokenizing reports the missing data
+            if not nltk.download(name, quiet=True):
+                missing.append(name)
+    if not missing:
+        os.makedirs(CACHE_FOLDER, exist_ok=True)
+        with open(NLTK_MARKER, 'w', encoding='utf-8') as f:
+            f.write(marker)
+    _nltk_ready = True
 
 # Folder containing resumes
 RESUME_FOLDER = "resumes/"
@@ -28,407 +67,382 @@ RESUME_FOLDER = "resumes/"
 # Ensure the resumes folder exists
 os.makedirs(RESUME_FOLDER, exist_ok=True)
 
-def analyze_resume(text):
-    """Analyze resume text using NLTK"""
-    # Tokenize the text
-    sentences = nltk.sent_tokenize(text)
-    words = nltk.word_tokenize(text)
-    
-    analysis = {
-        'skills': extract_skills(text),
-        'education': extract_education(sentences),
-        'experience': extract_experience(sentences),
-        'languages': extract_languages(text),
-        'certifications': extract_certifications(sentences)
-    }
-    return analysis
+# Output files, written to the output folder given to main()
+REPORT_FILE = "resume_report.html"
 
-def extract_skills(text):
-    """Extract skills focused on home care"""
-    # Home care specific skills
-    care_skills = {
-        'medical': [
-            'medicinhantering', 'sårvård', 'insulin', 'blodtryck', 'första hjälpen',
-            'hygien', 'förflyttningsteknik', 'lyftkörkort', 'dokumentation'
-        ],
-        'practical': [
-            'matlagning', 'städning', 'tvätt', 'inköp', 'personlig hygien',
-            'dusch', 'påklädning', 'toalettbesök', 'förflyttning'
-        ],
-        'social': [
-            'kommunikation', 'bemötande', 'social aktivitet', 'empati',
-            'tålamod', 'lyhörd', 'samarbete', 'flexibel', 'serviceorienterad'
-        ],
-        'technical': [
-            'dokumentationssystem', 'treserva', 'phoniro', 'procapita',
-            'office', 'excel', 'outlook', 'tidrapportering'
-        ]
-    }
+# Home care specific skills
+SKILL_KEYWORDS = {
+    'medical': [
+        'medicinhantering', 'sårvård', 'insulin', 'blodtryck', 'första hjälpen',
+        'hygien', 'förflyttningsteknik', 'lyftkörkort', 'dokumentation'
+    ],
+    'practical': [
+        'matlagning', 'städning', 'tvätt', 'inköp', 'personlig hygien',
+        'dusch', 'påklädning', 'toalettbesök', 'förflyttning'
+    ],
+    'social': [
+        'kommunikation', 'bemötande', 'social aktivitet', 'empati',
+        'tålamod', 'lyhörd', 'samarbete', 'flexibel', 'serviceorienterad'
+    ],
+    'technical': [
+        'dokumentationssystem', 'treserva', 'phoniro', 'procapita',
+        'office', 'excel', 'outlook', 'tidrapportering'
+    ]
+}
+
+EDUCATION_KEYWORDS = [
+    # Swedish healthcare education
+    'undersköterska', 'vårdbiträde', 'sjuksköterska', 'omvårdnad', 'vård och omsorg',
+    'hemtjänst utbildning', 'vårdutbildning', 'omsorgsutbildning',
+    # General education terms
+    'utbildning', 'kurs', 'gymnasium', 'komvux', 'yrkesutbildning',
+    'certifikat', 'diplom', 'betyg',
+    # Healthcare terms in English
+    'nursing', 'healthcare', 'care', 'medical', 'first aid', 'elderly care',
+    'home care', 'caregiver', 'nursing assistant'
+]
+
+EXPERIENCE_KEYWORDS = [
+    # Swedish home care terms
+    'hemtjänst', 'vårdbiträde', 'undersköterska', 'personlig assistent',
+    'äldreboende', 'vård och omsorg', 'omvårdnad', 'omsorg',
+    'serviceboende', 'hemsjukvård', 'boendestöd',
+    # Work-related terms
+    'erfarenhet', 'arbetade', 'jobbade', 'anställd', 'ansvarig',
+    # Care-related activities
+    'medicinhantering', 'sårvård', 'personlig hygien', 'städning',
+    'matlagning', 'inköp', 'social aktivitet', 'dokumentation',
+    # English terms
+    'home care', 'elderly care', 'personal care', 'assisted living',
+    'caregiver', 'care assistant', 'nursing home', 'senior care'
+]
+
+LANGUAGES = [
+    'english', 'spanish', 'french', 'german', 'chinese', 'japanese',
+    'arabic', 'russian', 'portuguese', 'italian', 'swedish', 'norwegian',
+    'danish', 'dutch', 'korean', 'hindi', 'bengali', 'urdu', 'turkish',
+    'vietnamese', 'thai', 'indonesian', 'malay', 'filipino', 'greek'
+]
+
+CERTIFICATION_KEYWORDS = ['certified', 'certification', 'certificate', 'license', 'diploma',
+                          'accredited', 'qualified']
+
+# Built once at startup: one automaton over every keyword list, so each
+# resume is scanned in a single pass instead of once per keyword
+KEYWORD_MATCHER = KeywordMatcher({
+    'skills': [skill for skills in SKILL_KEYWORDS.values() for skill in skills],
+    'languages': LANGUAGES,
+    'education': EDUCATION_KEYWORDS,
+    'experience': EXPERIENCE_KEYWORDS,
+    'certifications': CERTIFICATION_KEYWORDS,
+})
+
+# Bump whenever a change to the analysis alters its output, so that cached
+# results from older versions are not reused
+ANALYZER_VERSION = 3
+
+def analyzer_fingerprint():
+    """Hash identifying the analyzer version and its keyword sets"""
+    payload = json.dumps([ANALYZER_VERSION, SKILL_KEYWORDS, EDUCATION_KEYWORDS,
+                          EXPERIENCE_KEYWORDS, LANGUAGES, CERTIFICATION_KEYWORDS],
+                         ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+
+# Sections assigned per sentence, on top of the 'date' tag
+SENTENCE_SECTIONS = frozenset({'education', 'experience', 'certifications'})
+
+# Tags that put a sentence into each sentence level section
+SECTION_TAGS = {
+    'education': frozenset({'education'}),
+    'experience': frozenset({'experience', 'date'}),  # Dates or experience keywords
+    'certifications': frozenset({'certifications'}),
+}
+
+# Sections of an analysis, in report order
+ANALYSIS_SECTIONS = ('skills', 'education', 'experience', 'languages', 'certifications')
+
+# Bullet glyphs that start list items in CVs
+BULLET_PATTERN = re.compile(r'^\s*[•●▪■◦‣∙·*\-–—]+\s*')
+
+# Sentence punctuation followed by the start of a new sentence
+SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+(?=[A-ZÅÄÖÉÜ0-9(])')
+
+def segment_lines(text):
+    """Split text into sentences at line breaks, bullets and sentence punctuation
+
+    CVs are mostly bullet lists and short line-broken fragments, so every
+    line is its own unit and is only split further where one sentence ends
+    and another starts.
+    """
+    sentences = []
+    for line in text.splitlines():
+        line = BULLET_PATTERN.sub('', line).strip()
+        if line:
+            sentences.extend(SENTENCE_BREAK.split(line))
+    return sentences
+
+def segment_punkt(text):
+    """Split text into sentences with NLTK's Punkt tokenizer"""
+    ensure_nltk_data()
+    import nltk
+    return nltk.sent_tokenize(text)
+
+# Sentence segmenters selectable per run
+SEGMENTERS = {
+    'lines': segment_lines,
+    'punkt': segment_punkt,
+}
+# Punkt stays the default until 'lines' gives the same scores on real CVs,
+# as benchmark.py --segmenters measures
+DEFAULT_SEGMENTER = 'punkt'
+
+def find_keywords(text):
+    """Find every keyword occurrence as (start, end, keyword) offsets into text.lower()"""
+    return KEYWORD_MATCHER.find_all(text.lower())
+
+def shift_matches(matches, offset):
+    """Matches with their offsets moved by offset characters"""
+    return [match._replace(start=match.start + offset, end=match.end + offset)
+            for match in matches]
+
+def analyze_resume(text, normalize=False, score_only=False, metrics=NULL_METRICS,
+                   segmenter=DEFAULT_SEGMENTER):
+    """Analyze resume text
+
+    text is either a string or an iterable of page texts such as
+    iter_pdf_pages() yields, which is consumed one page at a time. With
+    score_only=True each section stops collecting once calculate_score would
+    give it full points, and reading stops as soon as every section is full;
+    the counts then only suffice for scoring, not for the report. Stage
+    timings and counters go to metrics. segmenter names one of SEGMENTERS.
+    """
+    segment = SEGMENTERS[segmenter]
+    pages = [text] if isinstance(text, str) else text
+    # Items per section keyed by their dedupe key, in order of first occurrence;
+    # normalize also folds sentences that differ only in whitespace or case
+    found = {section: {} for section in ANALYSIS_SECTIONS}
+    limits = None
+    if score_only:
+        limits = score_limits()
+        limits = {section: limits.get(section, 0) for section in ANALYSIS_SECTIONS}
     
-    found_skills = set()
-    text_lower = text.lower()
+    def saturated(section):
+        return limits is not None and len(found[section]) >= limits[section]
     
-    # Check for care-specific skills
-    for category, skills in care_skills.items():
-        for skill in skills:
-            if skill in text_lower:
-                found_skills.add(skill)
+    def add(section, key, item):
+        if not saturated(section):
+            found[section].setdefault(key, item)
     
-    return list(found_skills)
-
-def extract_education(sentences):
-    """Extract education information focused on healthcare and caregiving"""
-    education = []
-    edu_keywords = [
-        # Swedish healthcare education
-        'undersköterska', 'vårdbiträde', 'sjuksköterska', 'omvårdnad', 'vård och omsorg',
-        'hemtjänst utbildning', 'vårdutbildning', 'omsorgsutbildning',
-        # General education terms
-        'utbildning', 'kurs', 'gymnasium', 'komvux', 'yrkesutbildning',
-        'certifikat', 'diplom', 'betyg',
-        # Healthcare terms in English
-        'nursing', 'healthcare', 'care', 'medical', 'first aid', 'elderly care',
-        'home care', 'caregiver', 'nursing assistant'
-    ]
+    def add_sentences(sentences, text, matches):
+        metrics.count('sentences', len(sentences))
+        # One tagging pass shared by the sentence level extractors
+        if not all(saturated(section) for section in SECTION_TAGS):
+            with metrics.stage('classify'):
+                for clean_sent, tags in classify_sentences(sentences, text, matches):
+                    key = normalize_sentence(clean_sent) if normalize else clean_sent
+                    for section, section_tags in SECTION_TAGS.items():
+                        if not tags.isdisjoint(section_tags):
+                            add(section, key, clean_sent)
     
-    for sentence in sentences:
-        sent_lower = sentence.lower()
-        if any(keyword in sent_lower for keyword in edu_keywords):
-            clean_sent = sentence.strip()
-            if clean_sent and clean_sent not in education:
-                education.append(clean_sent)
+    # The last sentence of a page may go on on the next one, so its text is
+    # segmented again together with that page; pages give the same sentences
+    # as the text they join into
+    tail, tail_matches = '', []
+    for page in pages:
+        # One keyword scan per page, shared by the text level extractors and,
+        # through the match offsets, the sentence level ones
+        with metrics.stage('keywords'):
+            matches = find_keywords(page)
+            for skill in extract_skills(page, matches):
+                add('skills', skill, skill)
+            for language in extract_languages(page, matches):
+                add('languages', language, language)
+        metrics.count('keyword_hits', len(matches))
+        text, text_matches = page, matches
+        if tail:
+            text = tail + '\n' + page
+            text_matches = (None if tail_matches is None
+                            else tail_matches + shift_matches(matches, len(tail) + 1))
+        if len(page.lower()) != len(page):
+            # Lowercasing changed the length, so offsets into the lowercased
+            # page do not line up with its sentences; they are scanned instead
+            text_matches = None
+        # Split into sentences. No extractor consumes word tokens; one that
+        # does should call tokenize_words()
+        with metrics.stage('segment'):
+            sentences, tail = split_tail(text, segment(text))
+        tail_matches = None
+        if text_matches is not None:
+            start = len(text) - len(tail)
+            tail_matches = shift_matches([match for match in text_matches
+                                          if match.start >= start], -start)
+        add_sentences(sentences, text, text_matches)
+        if all(saturated(section) for section in ANALYSIS_SECTIONS):
+            break
+    else:
+        with metrics.stage('segment'):
+            sentences = segment(tail) if tail.strip() else []
+        add_sentences(sentences, tail, tail_matches)
     
-    return education
+    analysis = {section: list(items.values()) for section, items in found.items()}
+    return analysis
 
-def extract_experience(sentences):
-    """Extract work experience information focused on home care"""
-    experience = []
-    exp_keywords = [
-        # Swedish home care terms
-        'hemtjänst', 'vårdbiträde', 'undersköterska', 'personlig assistent',
-        'äldreboende', 'vård och omsorg', 'omvårdnad', 'omsorg',
-        'serviceboende', 'hemsjukvård', 'boendestöd',
-        # Work-related terms
-        'erfarenhet', 'arbetade', 'jobbade', 'anställd', 'ansvarig',
-        # Care-related activities
-        'medicinhantering', 'sårvård', 'personlig hygien', 'städning',
-        'matlagning', 'inköp', 'social aktivitet', 'dokumentation',
-        # English terms
-        'home care', 'elderly care', 'personal care', 'assisted living',
-        'caregiver', 'care assistant', 'nursing home', 'senior care'
-    ]
-    
+def split_tail(text, sentences):
+    """The sentences of text but the last, and text from the start of the last one on"""
+    if not sentences:
+        return [], text
+    start = text.rfind(sentences[-1])
+    if start < 0:
+        # The segmenter changed the text; keep its sentences as they are
+        return sentences, ''
+    return sentences[:-1], text[start:]
+
+@lru_cache(maxsize=32)
+def tokenize_words(text):
+    """Word tokens of a document, tokenized once and cached for later callers"""
+    ensure_nltk_data()
+    import nltk
+    return tuple(nltk.word_tokenize(text))
+
+def classify_sentences(sentences, text=None, matches=None):
+    """Tag every sentence with all the sections it belongs to in a single pass
+
+    Given text, which holds the sentences in order, and its keyword matches
+    from find_keywords, each sentence gets the matches within its span
+    instead of being scanned again.
+    """
+    ends = None if matches is None else [match.end for match in matches]
+    position = 0
+    tagged = []
     for sentence in sentences:
-        sent_lower = sentence.lower()
-        # Look for dates or experience keywords
-        has_date = bool(re.search(r'\b(19|20)\d{2}\b', sentence))
-        has_keyword = any(keyword in sent_lower for keyword in exp_keywords)
-        
-        if has_date or has_keyword:
-            clean_sent = sentence.strip()
-            if clean_sent and clean_sent not in experience:
-                experience.append(clean_sent)
-    
-    return experience
+        clean_sent = sentence.strip()
+        if not clean_sent:
+            continue
+        start = -1 if matches is None else text.find(clean_sent, position)
+        if start >= 0:
+            end = position = start + len(clean_sent)
+            # Matches come in order of their end offset
+            sentence_matches = [match for match in
+                                matches[bisect_left(ends, start + 1):bisect_right(ends, end)]
+                                if match.start >= start]
+        else:
+            # Lowercase once and run one automaton scan for all section keywords
+            sentence_matches = KEYWORD_MATCHER.find_all(clean_sent.lower())
+        tags = KEYWORD_MATCHER.groups_in(sentence_matches) & SENTENCE_SECTIONS
+        if YEAR_PATTERN.search(clean_sent):
+            tags.add('date')
+        tagged.append((clean_sent, tags))
+    return tagged
+
+def normalize_sentence(sentence):
+    """Collapse whitespace and case so trivially different copies compare equal"""
+    return ' '.join(sentence.split()).casefold()
+
+def dedupe(sentences, normalize=False):
+    """Drop repeated sentences in linear time, keeping the first occurrence"""
+    seen = set()
+    unique = []
+    for sentence in sentences:
+        key = normalize_sentence(sentence) if normalize else sentence
+        if key not in seen:
+            seen.add(key)
+            unique.append(sentence)
+    return unique
 
-def extract_languages(text):
+def select_sentences(tagged, *tags, normalize=False):
+    """Sentences carrying any of the given tags, without duplicates"""
+    return dedupe((clean_sent for clean_sent, sent_tags in tagged
+                   if not sent_tags.isdisjoint(tags)), normalize)
+
+def extract_skills(text, matches=None):
+    """Extract skills focused on home care"""
+    if matches is None:
+        matches = find_keywords(text)
+    return KEYWORD_MATCHER.keywords_in(matches, 'skills')
+
+def extract_education(sentences, tagged=None, normalize=False):
+    """Extract education information focused on healthcare and caregiving"""
+    if tagged is None:
+        tagged = classify_sentences(sentences)
+    return select_sentences(tagged, *SECTION_TAGS['education'], normalize=normalize)
+
+def extract_experience(sentences, tagged=None, normalize=False):
+    """Extract work experience information focused on home care"""
+    if tagged is None:
+        tagged = classify_sentences(sentences)
+    return select_sentences(tagged, *SECTION_TAGS['experience'], normalize=normalize)
+
+def extract_languages(text, matches=None):
     """Extract language skills"""
-    languages = {
-        'english', 'spanish', 'french', 'german', 'chinese', 'japanese',
-        'arabic', 'russian', 'portuguese', 'italian', 'swedish', 'norwegian',
-        'danish', 'dutch', 'korean', 'hindi', 'bengali', 'urdu', 'turkish',
-        'vietnamese', 'thai', 'indonesian', 'malay', 'filipino', 'greek'
-    }
-    
-    found_languages = set()
-    text_lower = text.lower()
-    
-    for lang in languages:
-        if lang in text_lower:
-            found_languages.add(lang)
-    
-    return list(found_languages)
+    if matches is None:
+        matches = find_keywords(text)
+    return KEYWORD_MATCHER.keywords_in(matches, 'languages')
 
-def extract_certifications(sentences):
+def extract_certifications(sentences, tagged=None, normalize=False):
     """Extract certifications"""
-    certifications = []
-    cert_keywords = ['certified', 'certification', 'certificate', 'license', 'diploma',
-                    'accredited', 'qualified']
-    
-    for sentence in sentences:
-        sent_lower = sentence.lower()
-        if any(keyword in sent_lower for keyword in cert_keywords):
-            clean_sent = sentence.strip()
-            if clean_sent and clean_sent not in certifications:
-                certifications.append(clean_sent)
-    
-    return certifications
+    if tagged is None:
+        tagged = classify_sentences(sentences)
+    return select_sentences(tagged, *SECTION_TAGS['certifications'], normalize=normalize)
 
-def calculate_score(analysis):
-    """Calculate a comprehensive score based on the analysis with focus on experience and education"""
-    score = 0
-    
-    # Experience score (up to 40 points) - Increased weight
-    exp_score = min(len(analysis['experience']) * 8, 40)
-    score += exp_score
-    
-    # Education score (up to 35 points) - Increased weight
-    edu_score = min(len(analysis['education']) * 7, 35)
-    score += edu_score
-    
-    # Skills score (up to 15 points) - Decreased weight
-    skill_score = min(len(analysis['skills']) * 1.5, 15)
-    score += skill_score
-    
-    # Languages score (up to 10 points) - Same weight
-    lang_score = min(len(analysis['languages']) * 2, 10)
-    score += lang_score
-    
-    return {
-        'total': score,
-        'breakdown': {
-            'experience': exp_score,  # Most important
-            'education': edu_score,   # Second most important
-            'skills': skill_score,    # Less weight
-            'languages': lang_score    # Same weight
-        }
-    }
-
-def extract_text_from_pdf(file_path):
-    """Extract text from a PDF file"""
+def open_document(source):
+    """Something PyPDF2 and python-docx can read from a path, bytes or binary buffer"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        # Wrapping bytes does not copy them
+        return io.BytesIO(source)
+    return source
+
+def document_name(source, filename=None):
+    """Name of a document for messages, filename if it is given"""
+    if filename:
+        return filename
+    if isinstance(source, str):
+        return source
+    return getattr(source, 'name', '<in-memory document>')
+
+def iter_pdf_pages(source, max_pages=None, filename=None):
+    """Yield the text of a PDF page by page, stopping after max_pages pages
+
+    source is a file path, bytes or a binary file-like object; filename
+    names it in error messages.
+    """
+    from PyPDF2 import PdfReader
     try:
-        reader = PdfReader(file_path)
-        text = []
-        for page in reader.pages:
-            text.append(page.extract_text())
-        return '\n'.join(text)
+        # Pages are parsed lazily, only as they are requested
+        reader = PdfReader(open_document(source))
+        for page_number, page in enumerate(reader.pages):
+            if max_pages is not None and page_number >= max_pages:
+                break
+            yield page.extract_text()
     except Exception as e:
-        print(f"Error extracting text from PDF {file_path}: {str(e)}")
-        return ""
+        print(f"Error extracting text from PDF {document_name(source, filename)}: {str(e)}")
+
+def extract_text_from_pdf(source, max_pages=None, filename=None):
+    """Extract text from a PDF file, bytes or buffer"""
+    return '\n'.join(iter_pdf_pages(source, max_pages, filename))
 
-def extract_text_from_docx(file_path):
-    """Extract text from a Word file"""
+def extract_text_from_docx(source, filename=None):
+    """Extract text from a Word file, bytes or buffer"""
+    from docx import Document
     try:
-        doc = Document(file_path)
+        doc = Document(open_document(source))
         text = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
         return text
     except Exception as e:
-        print(f"Error reading {file_path}: {e}")
+        print(f"Error reading {document_name(source, filename)}: {e}")
         return ""
 
 def generate_html_report(results_dict):
-    html_content = []
-    html_content.append('''
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>CV Sammanfattning</title>
-            <style>
-                :root {
-                    --primary-color: #2563eb;
-                    --background-color: #f8fafc;
-                    --text-color: #1e293b;
-                    --border-color: #e2e8f0;
-                    --tag-bg: #e0e7ff;
-                    --tag-color: #3730a3;
-                }
-                
-                * {
-                    margin: 0;
-                    padding: 0;
-                    box-sizing: border-box;
-                }
-                
-                body {
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    line-height: 1.6;
-                    background: var(--background-color);
-                    color: var(--text-color);
-                }
-                
-                .container {
-                    max-width: 1000px;
-                    margin: 2rem auto;
-                    padding: 0 1rem;
-                }
-                
-                .header {
-                    text-align: center;
-                    margin-bottom: 3rem;
-                    padding: 2rem 0;
-                }
-                
-                .header h1 {
-                    font-size: 2.5rem;
-                    color: var(--primary-color);
-                    margin-bottom: 1rem;
-                }
-                
-                .cv-list {
-                    display: grid;
-                    gap: 2rem;
-                }
-                
-                .cv-item {
-                    background: white;
-                    border-radius: 12px;
-                    box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-                    padding: 2rem;
-                    transition: transform 0.2s ease;
-                }
-                
-                .cv-item:hover {
-                    transform: translateY(-2px);
-                }
-                
-                .name {
-                    font-size: 1.5rem;
-                    font-weight: 600;
-                    color: var(--primary-color);
-                    margin-bottom: 1.5rem;
-                    padding-bottom: 1rem;
-                    border-bottom: 2px solid var(--border-color);
-                }
-                
-                .detail {
-                    margin: 1.5rem 0;
-                }
-                
-                .label {
-                    display: block;
-                    font-weight: 600;
-                    color: var(--text-color);
-                    margin-bottom: 0.5rem;
-                    font-size: 0.9rem;
-                    text-transform: uppercase;
-                    letter-spacing: 0.05em;
-                }
-                
-                .content {
-                    background: var(--background-color);
-                    padding: 1rem;
-                    border-radius: 8px;
-                }
-                
-                ul {
-                    list-style: none;
-                }
-                
-                li {
-                    margin: 0.5rem 0;
-                    padding-left: 1.5rem;
-                    position: relative;
-                }
-                
-                li:before {
-                    content: "•";
-                    color: var(--primary-color);
-                    position: absolute;
-                    left: 0;
-                }
-                
-                .competence-item {
-                    display: inline-block;
-                    background: var(--tag-bg);
-                    color: var(--tag-color);
-                    padding: 0.3rem 0.8rem;
-                    margin: 0.25rem;
-                    border-radius: 20px;
-                    font-size: 0.9rem;
-                    font-weight: 500;
-                    transition: all 0.2s ease;
-                }
-                
-                .competence-item:hover {
-                    transform: scale(1.05);
-                }
-                
-                @media (max-width: 768px) {
-                    .container {
-                        margin: 1rem auto;
-                    }
-                    
-                    .cv-item {
-                        padding: 1.5rem;
-                    }
-                    
-                    .header h1 {
-                        font-size: 2rem;
-                    }
-                }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <header class="header">
-                    <h1>CV Sammanfattning</h1>
-                </header>
-                <div class="cv-list">
-    ''')
-
-    for name, result in results_dict.items():
-        html_content.append(f'''
-            <div class="cv-item">
-                <div class="name">{name}</div>
-                
-                <div class="detail">
-                    <span class="label">Färdigheter</span>
-                    <div class="content">
-                        {''.join(f"<span class='competence-item'>{skill}</span>" for skill in result['skills']) if result['skills'] else 'Inga färdigheter angivna'}
-                    </div>
-                </div>
-
-                <div class="detail">
-                    <span class="label">Utbildning</span>
-                    <div class="content">
-                        <ul>
-                            {''.join(f"<li>{edu}</li>" for edu in result['education']) if result['education'] else '<li>Ingen utbildning angiven</li>'}
-                        </ul>
-                    </div>
-                </div>
-
-                <div class="detail">
-                    <span class="label">Arbetslivserfarenhet</span>
-                    <div class="content">
-                        <ul>
-                            {''.join(f"<li>{exp}</li>" for exp in result['experience']) if result['experience'] else '<li>Ingen arbetslivserfarenhet angiven</li>'}
-                        </ul>
-                    </div>
-                </div>
-
-                <div class="detail">
-                    <span class="label">Språkkunskaper</span>
-                    <div class="content">
-                        <ul>
-                            {''.join(f"<li>{lang}</li>" for lang in result['languages']) if result['languages'] else '<li>Inga språk angivna</li>'}
-                        </ul>
-                    </div>
-                </div>
-
-                <div class="detail">
-                    <span class="label">Certifikat</span>
-                    <div class="content">
-                        <ul>
-                            {''.join(f"<li>{cert}</li>" for cert in result['certifications']) if result['certifications'] else '<li>Inga certifikat angivna</li>'}
-                        </ul>
-                    </div>
-                </div>
-            </div>
-        ''')
-
-    html_content.append('''
-                </div>
-            </div>
-        </body>
-        </html>
-    ''')
-
-    return ''.join(html_content)
+    """Whole HTML report as a string; main() streams it to disk with ReportWriter instead"""
+    return render_report(results_dict)
 
 def send_email_report(recipient_email, sender_email, sender_password):
     """Send the resume report via email"""
+    import smtplib
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+    
     try:
         # Create the email message
         msg = MIMEMultipart()
@@ -460,53 +474,427 @@ def send_email_report(recipient_email, sender_email, sender_password):
         print(f'Error sending email: {str(e)}')
         return False
 
-def main():
-    # Process all resumes in the folder
-    results = []
-    for filename in os.listdir(RESUME_FOLDER):
-        if filename.startswith('.'):  # Skip hidden files like .DS_Store
-            continue
-            
-        file_path = os.path.join(RESUME_FOLDER, filename)
-        try:
-            if verify_document(file_path):
-                if file_path.lower().endswith('.pdf'):
-                    content = extract_text_from_pdf(file_path)
-                else:
-                    content = extract_text_from_docx(file_path)
-                
-                result = analyze_resume(content)
-                if result:
-                    # Add filename as name if not found in content
-                    if 'Name' not in result or not result['Name']:
-                        result['Name'] = os.path.splitext(filename)[0].replace('_', ' ')
-                    results.append(result)
-        except Exception as e:
-            print(f"Error processing {filename}: {str(e)}")
-
-    # Convert results to dictionary
-    results_dict = {result['Name']: result for result in results}
+def verify_document(file_path):
+    """Check that a path is a non-empty PDF or Word file"""
+    return (os.path.isfile(file_path)
+            and file_path.lower().endswith(('.pdf', '.docx'))
+            and os.path.getsize(file_path) > 0)
+
+def list_resumes(folder=RESUME_FOLDER):
+    """Paths of all resumes in a folder, in a stable order"""
+    # Skip hidden files like .DS_Store and subfolders such as archives
+    return [os.path.join(folder, filename)
+            for filename in sorted(os.listdir(folder))
+            if not filename.startswith('.') and os.path.isfile(os.path.join(folder, filename))]
+
+def iter_text(source, max_pages=None, filename=None):
+    """Yield the text of a PDF or Word document in pages
+
+    The format is taken from filename, which defaults to source for paths.
+    """
+    filename = document_name(source, filename)
+    if filename.lower().endswith('.pdf'):
+        yield from iter_pdf_pages(source, max_pages, filename)
+    else:
+        # Word files have no fixed pages and are read in one go
+        yield extract_text_from_docx(source, filename)
+
+def extract_text(source, max_pages=None, filename=None):
+    """Extract text from a PDF or Word document"""
+    return '\n'.join(iter_text(source, max_pages, filename))
+
+def hash_document(source):
+    """SHA-256 of a document given as a path, bytes or binary buffer"""
+    if isinstance(source, str):
+        return hash_file(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(source).hexdigest()
+    if hasattr(source, 'getbuffer'):
+        # In-memory buffers such as Streamlit uploads are hashed in place
+        return hashlib.sha256(source.getbuffer()).hexdigest()
+    digest = hashlib.sha256()
+    position = source.tell()
+    for chunk in iter(lambda: source.read(1024 * 1024), b''):
+        digest.update(chunk)
+    source.seek(position)
+    return digest.hexdigest()
+
+def open_cache(max_bytes=DEFAULT_MAX_BYTES):
+    """Result cache for the current analyzer, or None if it cannot be created
+
+    On a read-only filesystem analysis simply runs uncached.
+    """
+    try:
+        return ResultCache(CACHE_FOLDER, analyzer_fingerprint(), max_bytes)
+    except OSError:
+        return None
+
+def warm_up(segmenter=DEFAULT_SEGMENTER):
+    """Load everything analysis imports lazily, e.g. in a fresh worker process
+
+    The keyword automaton is built when this module is imported.
+    """
+    import PyPDF2
+    import docx
+    if segmenter == 'punkt':
+        ensure_nltk_data()
+        import nltk
+
+def document_size(source):
+    """Size in bytes of a document given as a path, bytes or buffer, if known"""
+    if isinstance(source, str):
+        return os.path.getsize(source)
+    if isinstance(source, (bytes, bytearray)):
+        return len(source)
+    if isinstance(source, memoryview):
+        return source.nbytes
+    if hasattr(source, 'getbuffer'):
+        return source.getbuffer().nbytes
+    return 0
+
+def analyze_file(source, cache=None, max_pages=None, score_only=False, filename=None,
+                 metrics=NULL_METRICS, segmenter=DEFAULT_SEGMENTER):
+    """Extract, analyze and score a resume, reusing cached results
+
+    source is a file path, bytes or a binary file-like object; for the latter
+    two filename tells PDF from Word. Pages are analyzed as they are
+    extracted. Returns a dict with the extracted 'text', its 'analysis' and
+    'score'.
+    """
+    metrics.count('bytes', document_size(source))
+    key = None
+    if cache is not None:
+        with metrics.stage('cache'):
+            variant = f'max_pages={max_pages},score_only={score_only},segmenter={segmenter}'
+            key = cache.key(hash_document(source), variant)
+            cached = cache.get(key)
+        if cached is not None:
+            metrics.count('cache_hits')
+            return cached
     
-    # Calculate scores
-    scores = [calculate_score(result) for result in results_dict.values()]
+    pages = []
+    def read_pages():
+        page_iter = iter_text(source, max_pages, filename)
+        while True:
+            # Only the parsing is timed here; analysis happens between pages
+            with metrics.stage('extract'):
+                page = next(page_iter, None)
+            if page is None:
+                return
+            metrics.count('pages')
+            pages.append(page)
+            yield page
     
-    # Generate and save the HTML report
-    html_content = generate_html_report(results_dict)
+    analysis = analyze_resume(read_pages(), score_only=score_only, metrics=metrics,
+                              segmenter=segmenter)
+    text = '\n'.join(pages)
+    with metrics.stage('score'):
+        score = calculate_score(analysis)
+    entry = {'text': text, 'analysis': analysis, 'score': score}
+    if cache is not None:
+        with metrics.stage('cache'):
+            cache.put(key, entry)
+    return entry
+
+def analyze_file_scored(source, *args, **kwargs):
+    """analyze_file's 'analysis' and 'score' without the extracted text
+
+    Keeps results sent back from worker processes and held in memory small.
+    """
+    entry = analyze_file(source, *args, **kwargs)
+    return {'analysis': entry['analysis'], 'score': entry['score']}
+
+def process_document(source, filename, cache=None, max_pages=None, score_only=False,
+                     metrics_log=None, segmenter=DEFAULT_SEGMENTER):
+    """Extract, analyze and score a single resume given as a path, bytes or buffer
+
+    Returns a (result, score) pair, or None if the document could not be
+    processed. Errors are reported and swallowed so one bad file never stops
+    a batch. With metrics_log set, the file's stage timings and counters are
+    appended to that JSON lines file.
+    """
+    metrics = FileMetrics(filename) if metrics_log else NULL_METRICS
+    processed = None
+    try:
+        entry = analyze_file(source, cache, max_pages, score_only, filename, metrics, segmenter)
+        result = entry['analysis']
+        if result:
+            # Add filename as name if not found in content
+            if 'Name' not in result or not result['Name']:
+                result['Name'] = os.path.splitext(filename)[0].replace('_', ' ')
+            processed = result, entry['score']
+    except Exception as e:
+        metrics.count('errors')
+        print(f"Error processing {filename}: {str(e)}")
+    if metrics_log:
+        metrics.write(metrics_log)
+    return processed
+
+def process_resume(file_path, **options):
+    """Extract, analyze and score a single resume file; options as for process_document"""
+    if not verify_document(file_path):
+        return None
+    return process_document(file_path, os.path.basename(file_path), **options)
+
+def read_resume(file_path):
+    """(file_path, bytes) of a resume file, or None if it is not one or cannot be read"""
+    if not verify_document(file_path):
+        return None
+    try:
+        with open(file_path, 'rb') as f:
+            return file_path, f.read()
+    except OSError as e:
+        print(f"Error reading {file_path}: {e}")
+        return None
+
+def process_read_resume(read, **options):
+    """process_document for a read_resume result"""
+    if read is None:
+        return None
+    file_path, data = read
+    return process_document(data, os.path.basename(file_path), **options)
+
+def iter_resumes(file_paths, workers=1, read_workers=1, queue_depth=None, **options):
+    """Yield process_resume results through a bounded read -> analyze pipeline
+
+    read_workers threads read files ahead of the analysis, which runs in a
+    pool of workers processes when workers > 1 (or read_workers=0 for the
+    workers to read the files themselves). Each stage keeps at most
+    queue_depth files in flight, so memory stays flat however many files
+    there are. Results come in the order of file_paths regardless of which
+    worker finishes first, each as soon as it and those before it are done.
+    """
+    analyze_workers = workers if workers > 1 and len(file_paths) > 1 else 0
+    if read_workers:
+        stages = [Stage('read', read_resume, read_workers, depth=queue_depth),
+                  Stage('analyze', partial(process_read_resume, **options), analyze_workers,
+                        processes=True, depth=queue_depth)]
+    else:
+        stages = [Stage('analyze', partial(process_resume, **options), analyze_workers,
+                        processes=True, depth=queue_depth)]
+    return Pipeline(stages).run(file_paths)
+
+def process_resumes(file_paths, workers=1, **options):
+    """Process resumes as a list, in the order of file_paths"""
+    return list(iter_resumes(file_paths, workers, **options))
+
+def main(workers=1, use_cache=True, cache_size=DEFAULT_MAX_BYTES, incremental=False,
+         max_pages=None, score_only=False, resume_folder=RESUME_FOLDER, output_folder='.',
+         metrics_log=None, segmenter=DEFAULT_SEGMENTER, results_format='csv',
+         report_page_size=None, top=None, read_workers=1, queue_depth=None, progress=None,
+         cancel=None):
+    """Analyze the resumes in resume_folder and write the reports to output_folder
+
+    progress, if given, is called with each file path and its
+    process_resume result as files finish. Setting the cancel event stops
+    the batch after the files in flight; the outputs then cover the files
+    analyzed so far. Returns the number of candidates written.
+    """
+    if metrics_log:
+        # Start a fresh log; workers append one line per file
+        open(metrics_log, 'w').close()
+    batch_metrics = FileMetrics('<batch>') if metrics_log else NULL_METRICS
     
-    # Save the report
-    report_file = 'resume_report.html'
-    with open(report_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Unchanged files are served from the result cache
+    cache = open_cache(cache_size) if use_cache else None
+    file_paths = list_resumes(resume_folder)
+    options = {'cache': cache, 'max_pages': max_pages, 'score_only': score_only,
+               'metrics_log': metrics_log, 'segmenter': segmenter,
+               'read_workers': read_workers, 'queue_depth': queue_depth}
     
-    # Save results to CSV
-    if results:
-        df = pd.DataFrame(results)
-        df.to_csv('cv_report.csv', index=False, encoding='utf-8')
-        print(f"Successfully processed {len(results)} resumes")
+    if incremental:
+        # Only process new and changed files; rows for the rest come from the
+        # manifest, deleted files drop out of it and files that are not
+        # resumes are never read
+        manifest = open_manifest(output_folder, max_pages, score_only, segmenter)
+        changed = manifest.changed([path for path in file_paths if verify_document(path)])
+        processed_changed = track_progress(changed, iter_resumes(changed, workers, **options),
+                                           progress, cancel)
+        for file_path, processed in zip(changed, processed_changed):
+            manifest.record(file_path, processed)
+        manifest.save()
+        print(f"Found {len(changed)} new or changed resumes")
+        all_processed = manifest.results(file_paths)
+    else:
+        # Process all resumes in the folder
+        all_processed = track_progress(file_paths, iter_resumes(file_paths, workers, **options),
+                                       progress, cancel)
+    
+    count = write_outputs(all_processed, output_folder, score_only, results_format,
+                          report_page_size, top, batch_metrics)
+    
+    if metrics_log:
+        batch_metrics.write(metrics_log)
+        print_summary(read_metrics(metrics_log))
+    return count
+
+def track_progress(file_paths, all_processed, progress=None, cancel=None):
+    """Pass process_resume results through, reporting each and stopping once cancel is set"""
+    for file_path, processed in zip(file_paths, all_processed):
+        if progress:
+            progress(file_path, processed)
+        yield processed
+        if cancel is not None and cancel.is_set():
+            print("Cancelled")
+            # Closing the pipeline lets the files being analyzed finish and
+            # cancels the queued ones
+            all_processed.close()
+            return
+
+def open_manifest(output_folder='.', max_pages=None, score_only=False,
+                  segmenter=DEFAULT_SEGMENTER):
+    """Manifest of incremental runs with these analysis options and this analyzer"""
+    return Manifest(os.path.join(output_folder, MANIFEST_FILE),
+                    options={'max_pages': max_pages, 'score_only': score_only,
+                             'segmenter': segmenter, 'analyzer': analyzer_fingerprint()})
+
+def write_outputs(all_processed, output_folder='.', score_only=False, results_format='csv',
+                  report_page_size=None, top=None, metrics=NULL_METRICS):
+    """Write the result tables, feature store and HTML report for process_resume results
+
+    all_processed may be a stream; None entries for failed files are skipped.
+    Returns the number of candidates written.
+    """
+    all_processed = (processed for processed in all_processed if processed)
+    
+    # Feature vectors of every candidate, for rescoring under other profiles;
+    # score-only runs stop counting items early, so they keep the old store
+    keywords = [keyword for keyword in KEYWORD_MATCHER.keywords
+                if KEYWORD_MATCHER.groups[keyword].intersection(KEYWORD_SECTIONS)]
+    features = None if score_only else FeatureWriter(os.path.join(output_folder, FEATURES_FILE),
+                                                     ANALYSIS_SECTIONS, keywords)
+    if features:
+        all_processed = features.collect(all_processed)
+    
+    if top:
+        # Only the best candidates are written, best first
+        all_processed = top_candidates(all_processed, top)
+        print(f"Ranked the top {len(all_processed)} candidates")
+    
+    # Rows and report cards are written as results arrive; with score_only
+    # the sections were cut short, so only the candidates table is worth writing
+    report = None if score_only else ReportWriter(os.path.join(output_folder, REPORT_FILE),
+                                                  report_page_size)
+    with ResultsWriter(output_folder, results_format, write_items=not score_only) as writer:
+        for result, score in all_processed:
+            with metrics.stage('write_results'):
+                writer.add(result, score)
+            if report:
+                with metrics.stage('write_html'):
+                    report.add(result['Name'], result)
+    
+    if score_only:
+        print(f"Successfully scored {writer.count} resumes")
+    else:
+        with metrics.stage('write_html'):
+            report.close()
+        features.close()
+        if writer.count:
+            print(f"Successfully processed {writer.count} resumes")
+    return writer.count
+
+def rescore_candidates(profile_name, profiles_file=PROFILES_FILE, output_folder='.',
+                       results_format='csv', top=None):
+    """Score the stored features of the last run under another profile
+
+    No document is read again. The candidates are written best first to
+    cv_candidates_<profile>.
+    """
+    profiles = load_profiles(profiles_file)
+    if profile_name not in profiles:
+        raise ValueError(f"Unknown scoring profile '{profile_name}', "
+                         f"choose from: {', '.join(sorted(profiles))}")
+    features = load_features(os.path.join(output_folder, FEATURES_FILE))
+    totals, breakdown, columns = rescore(features, profiles[profile_name])
+    scored = zip(({'Name': name} for name in features.names),
+                 score_dicts(totals, breakdown, columns))
+    ranked = top_candidates(scored, top) if top else rank_candidates(scored)
+    with ResultsWriter(output_folder, results_format, write_items=False,
+                       candidates_table=f'{CANDIDATES_TABLE}_{profile_name}') as writer:
+        for result, score in ranked:
+            writer.add(result, score)
+    print(f"Rescored {len(features)} candidates with profile '{profile_name}'")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze all resumes in the resumes folder")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="number of worker processes (default: 1, 0 = one per CPU)")
+    parser.add_argument('--read-workers', type=int, default=1,
+                        help="threads reading files ahead of the analysis (default: 1, "
+                             "0 = analysis workers read their own files)")
+    parser.add_argument('--queue-depth', type=int,
+                        help="files each pipeline stage may hold at once "
+                             "(default: 4 per worker)")
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                        help="re-analyze every file instead of reusing cached results")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help="maximum result cache size in MB (default: %(default)s)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only process files added or changed since the last incremental run")
+    parser.add_argument('--max-pages', type=int,
+                        help="only analyze the first N pages of each PDF")
+    parser.add_argument('--score-only', action='store_true',
+                        help="only compute scores, written to the candidates table; stops "
+                             "reading each resume once every score is maxed out")
+    parser.add_argument('--metrics', dest='metrics_log', metavar='PATH',
+                        help="record per-file stage timings and counters to this JSON lines "
+                             "file and print a summary")
+    parser.add_argument('--segmenter', choices=sorted(SEGMENTERS), default=DEFAULT_SEGMENTER,
+                        help="sentence segmenter (default: %(default)s)")
+    parser.add_argument('--results-format', choices=FORMATS, default='csv',
+                        help="format of the cv_candidates and cv_items result tables; "
+                             "parquet needs pyarrow (default: %(default)s)")
+    parser.add_argument('--report-pages', dest='report_page_size', type=int, nargs='?',
+                        const=DEFAULT_PAGE_SIZE, metavar='N',
+                        help="split the HTML report into pages of N candidates behind an "
+                             f"index page (default N: {DEFAULT_PAGE_SIZE})")
+    parser.add_argument('--top', type=int, metavar='K',
+                        help="only report the K highest scoring candidates, best first "
+                             "(ties go to experience, then education)")
+    parser.add_argument('--rescore', metavar='PROFILE',
+                        help="don't analyze anything; rescore the candidates of the last run "
+                             "from their stored features under this scoring profile")
+    parser.add_argument('--profiles', default=PROFILES_FILE, metavar='PATH',
+                        help="scoring profiles file (default: %(default)s)")
+    parser.add_argument('--watch', action='store_true',
+                        help="keep running and analyze resumes as they are added or changed")
+    parser.add_argument('--poll', action='store_true',
+                        help="with --watch, poll the folder instead of using watchdog")
+    parser.add_argument('--settle', type=float, default=2.0, metavar='SECONDS',
+                        help="with --watch, how long a file must stay unchanged before it "
+                             "is analyzed (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.workers == 0:
+        args.workers = os.cpu_count() or 1
+    return args
 
 if __name__ == "__main__":
-    main()
+    import webbrowser
+    args = parse_args()
+    if args.rescore:
+        try:
+            rescore_candidates(args.rescore, args.profiles, results_format=args.results_format,
+                               top=args.top)
+        except (OSError, ValueError) as e:
+            sys.exit(f"Error: {e}")
+        sys.exit(0)
+    if args.watch:
+        from watcher import ResumeWatcher
+        ResumeWatcher(RESUME_FOLDER, workers=args.workers, settle=args.settle, polling=args.poll,
+                      use_cache=args.use_cache, max_pages=args.max_pages,
+                      score_only=args.score_only, segmenter=args.segmenter,
+                      results_format=args.results_format,
+                      report_page_size=args.report_page_size, top=args.top).run()
+        sys.exit(0)
+    main(workers=args.workers, use_cache=args.use_cache,
+         cache_size=args.cache_size * 1024 * 1024, incremental=args.incremental,
+         max_pages=args.max_pages, score_only=args.score_only, metrics_log=args.metrics_log,
+         segmenter=args.segmenter, results_format=args.results_format,
+         report_page_size=args.report_page_size, top=args.top,
+         read_workers=args.read_workers, queue_depth=args.queue_depth)
+    if args.score_only:
+        sys.exit(0)
     # Open the generated report in the default web browser
-    report_path = os.path.abspath('resume_report.html')
+    report_path = os.path.abspath(REPORT_FILE)
     print(f"Opening report: {report_path}")
     webbrowser.open('file://' + report_path)
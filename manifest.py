@@ -0,0 +1,102 @@
+import os
+import json
+import tempfile
+
+from result_cache import hash_file
+
+# Default manifest location, next to the generated reports
+MANIFEST_FILE = ".resume_manifest.json"
+
+def signature(file_path):
+    """(size, mtime, content hash) of a file"""
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns, hash_file(file_path)
+
+class Manifest:
+    """Record of processed resume files, used to re-scan a folder incrementally
+
+    Each entry holds a file's size, mtime, content hash and the result row it
+    produced. A file whose size and mtime are unchanged is trusted as is; if
+    either differs the content hash decides, so touching a file does not force
+    it to be re-analyzed. The size, mtime and hash recorded for a file are
+    those seen when it was found to have changed, before it was analyzed.
+    """
+
+    def __init__(self, path=MANIFEST_FILE, options=None):
+        # Rows produced under different analysis options or analyzers are not reused
+        self.path = path
+        self.options = options or {}
+        self.entries = {}
+        self.seen = {}   # path -> (size, mtime, hash) of changed files until recorded
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('options') == self.options:
+                self.entries = data['entries']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def changed(self, file_paths):
+        """Paths that are new or whose content changed since they were recorded
+
+        Entries for files that are no longer present are dropped.
+        """
+        present = set(file_paths)
+        for file_path in list(self.entries):
+            if file_path not in present:
+                del self.entries[file_path]
+
+        return [file_path for file_path in file_paths if self.is_changed(file_path)]
+
+    def is_changed(self, file_path):
+        """Whether a file is new or its content changed since it was recorded"""
+        entry = self.entries.get(file_path)
+        stat = os.stat(file_path)
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            return False
+        content_hash = hash_file(file_path)
+        if entry and entry['hash'] == content_hash:
+            # Same content, only the metadata moved
+            entry['size'] = stat.st_size
+            entry['mtime'] = stat.st_mtime_ns
+            return False
+        self.seen[file_path] = (stat.st_size, stat.st_mtime_ns, content_hash)
+        return True
+
+    def record(self, file_path, processed):
+        """Store the outcome of processing a file; None marks a failed file
+
+        A file rewritten while it was processed keeps the signature of the
+        content that was processed, so the next run picks the new one up.
+        """
+        size, mtime, content_hash = self.seen.pop(file_path, None) or signature(file_path)
+        self.entries[file_path] = {
+            'size': size,
+            'mtime': mtime,
+            'hash': content_hash,
+            'result': processed[0] if processed else None,
+            'score': processed[1] if processed else None,
+        }
+
+    def forget(self, file_path):
+        """Drop the entry of a file that was removed"""
+        self.entries.pop(file_path, None)
+
+    def results(self, file_paths):
+        """(result, score) pairs for file_paths in order, None where processing failed"""
+        processed = []
+        for file_path in file_paths:
+            entry = self.entries.get(file_path)
+            if entry and entry['result'] is not None:
+                processed.append((entry['result'], entry['score']))
+            else:
+                processed.append(None)
+        return processed
+
+    def save(self):
+        """Write the manifest atomically"""
+        folder = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=folder, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'options': self.options, 'entries': self.entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
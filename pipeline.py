@@ -0,0 +1,75 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import ExitStack, closing
+
+class Stage:
+    """One step of a Pipeline: fn applied to every item
+
+    workers threads (or processes, for CPU bound steps) run fn concurrently
+    and at most depth items are in flight or waiting to be picked up by the
+    next stage; a stage with workers=0 runs fn inline in the consuming
+    thread. depth defaults to four items per worker.
+    """
+
+    def __init__(self, name, fn, workers=1, processes=False, depth=None):
+        self.name = name
+        self.fn = fn
+        self.workers = workers
+        self.processes = processes
+        self.depth = depth or max(1, workers * 4)
+
+    def executor(self):
+        if self.workers <= 0:
+            return None
+        if self.processes:
+            return ProcessPoolExecutor(max_workers=self.workers)
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=self.name)
+
+def bounded_map(executor, fn, items, depth):
+    """Yield fn(item) for items in order, with at most depth calls pending
+
+    Items are only pulled from upstream while there is room, so a slow
+    consumer holds everything before it back instead of letting results
+    pile up in memory. Closing the generator cancels the calls that have
+    not started yet.
+    """
+    if executor is None:
+        for item in items:
+            yield fn(item)
+        return
+
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= depth:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+class Pipeline:
+    """Stages connected by bounded windows of work
+
+    Every stage works on its next items while later stages are still busy
+    with earlier ones; results come out in input order. Memory use is bound
+    by the sum of the stage depths, not by the number of items. Closing the
+    generator returned by run stops every stage once its running calls
+    finish.
+    """
+
+    def __init__(self, stages):
+        self.stages = stages
+
+    def run(self, items):
+        with ExitStack() as stack:
+            for stage in self.stages:
+                executor = stage.executor()
+                if executor is not None:
+                    stack.enter_context(executor)
+                # Closed before its executor shuts down, last stage first
+                items = stack.enter_context(closing(
+                    bounded_map(executor, stage.fn, items, stage.depth)))
+            yield from items
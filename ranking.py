@@ -0,0 +1,22 @@
+import heapq
+
+# Sections that break ties between equal totals, in order
+TIE_BREAKERS = ('experience', 'education')
+
+def rank_key(score):
+    """Sort key of a score: the total, then the tie-breaking sections"""
+    breakdown = score['breakdown']
+    return (score['total'], *(breakdown.get(section, 0) for section in TIE_BREAKERS))
+
+def top_candidates(processed, k):
+    """The k best (result, score) pairs of processed, best first
+
+    processed may be any iterable, e.g. a stream of results as files finish;
+    only k pairs are held at a time, so this runs in O(n log k). Candidates
+    that are still tied keep their input order.
+    """
+    return heapq.nlargest(k, processed, key=lambda pair: rank_key(pair[1]))
+
+def rank_candidates(processed):
+    """All (result, score) pairs of processed, best first"""
+    return sorted(processed, key=lambda pair: rank_key(pair[1]), reverse=True)
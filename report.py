@@ -0,0 +1,120 @@
+import os
+from functools import lru_cache
+
+# Report templates live in templates/report/, next to the web app's templates
+TEMPLATE_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+# Candidate cards per page in paginated mode
+DEFAULT_PAGE_SIZE = 500
+
+REPORT_TITLE = "CV Sammanfattning"
+
+@lru_cache(maxsize=None)
+def template_environment():
+    """Jinja2 environment for the report, created once per process
+
+    Templates are compiled on first use and kept; auto_reload is off so
+    rendering never goes back to the filesystem to check for changes.
+    """
+    from jinja2 import Environment, FileSystemLoader
+    return Environment(loader=FileSystemLoader(TEMPLATE_FOLDER), autoescape=True,
+                       auto_reload=False, trim_blocks=True, lstrip_blocks=True,
+                       keep_trailing_newline=True)
+
+@lru_cache(maxsize=None)
+def get_template(name):
+    """Compiled templates/report/<name>.html"""
+    return template_environment().get_template(f'report/{name}.html')
+
+def render_candidate(name, result):
+    """HTML card for one candidate"""
+    return get_template('candidate').render(name=name, result=result)
+
+def render_report(results_dict, title=REPORT_TITLE):
+    """Whole single-page report for a name -> result mapping"""
+    parts = [get_template('page_start').render(title=title)]
+    parts.extend(render_candidate(name, result) for name, result in results_dict.items())
+    parts.append(get_template('page_end').render())
+    return ''.join(parts)
+
+class ReportWriter:
+    """Writes the HTML report to disk card by card as results arrive
+
+    With page_size set, the cards are split over numbered pages next to path
+    (resume_report-1.html, resume_report-2.html, ...) holding page_size
+    candidates each, and path becomes an index page linking to them, so the
+    report stays small enough for a browser to open. Only the names for the
+    index are kept in memory. Pages left over from an earlier, longer report
+    are removed on close.
+    """
+
+    def __init__(self, path, page_size=None, title=REPORT_TITLE):
+        self.path = path
+        self.page_size = page_size
+        self.title = title
+        self.count = 0
+        self.pages = []  # (file name, candidate names) per page
+        self._file = None
+
+    def page_path(self, number):
+        stem, ext = os.path.splitext(self.path)
+        return f'{stem}-{number}{ext}'
+
+    def _pager(self, number, next_name=None):
+        if not self.page_size:
+            return None
+        return {'index_name': os.path.basename(self.path),
+                'previous_name': self.pages[number - 2][0] if number > 1 else None,
+                'next_name': next_name}
+
+    def _open(self, path, title, pager=None):
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write(get_template('page_start').render(title=title, pager=pager))
+
+    def _close_page(self, next_name=None):
+        self._file.write(get_template('page_end').render(pager=self._pager(len(self.pages), next_name)))
+        self._file.close()
+        self._file = None
+
+    def add(self, name, result):
+        """Append one candidate's card"""
+        if self.page_size and self.count % self.page_size == 0:
+            number = len(self.pages) + 1
+            page_name = os.path.basename(self.page_path(number))
+            if self._file:
+                self._close_page(next_name=page_name)
+            self.pages.append((page_name, []))
+            self._open(self.page_path(number), f'{self.title} – sida {number}', self._pager(number))
+        elif self._file is None:
+            self._open(self.path, self.title)
+
+        self._file.write(render_candidate(name, result))
+        if self.page_size:
+            self.pages[-1][1].append(name)
+        self.count += 1
+
+    def close(self):
+        if self._file:
+            self._close_page()
+        if self.page_size:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(get_template('index').render(title=self.title, count=self.count,
+                                                     pages=self.pages))
+        elif self.count == 0:
+            # Still write an (empty) report
+            self._open(self.path, self.title)
+            self._close_page()
+        self._remove_stale_pages()
+
+    def _remove_stale_pages(self):
+        number = len(self.pages) + 1
+        while os.path.exists(self.page_path(number)):
+            os.remove(self.page_path(number))
+            number += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
@@ -0,0 +1,100 @@
+import os
+import json
+import hashlib
+import tempfile
+
+# Default cache location and size bound
+CACHE_FOLDER = ".resume_cache/"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+def hash_file(file_path, chunk_size=1024 * 1024):
+    """SHA-256 of a file's bytes, read in chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ResultCache:
+    """Persistent cache of analysis results keyed by document content
+
+    Entries are JSON files named after the SHA-256 of the document bytes
+    combined with a fingerprint of the analyzer, so changing the analyzer
+    or its keywords invalidates every entry. Reads refresh an entry's mtime
+    and the least recently used entries are evicted once the cache grows
+    past max_bytes.
+    """
+
+    def __init__(self, folder=CACHE_FOLDER, fingerprint='', max_bytes=DEFAULT_MAX_BYTES):
+        self.folder = folder
+        self.fingerprint = fingerprint
+        self.max_bytes = max_bytes
+        os.makedirs(folder, exist_ok=True)
+        # Approximate size, only re-measured when eviction runs
+        self._size = sum(size for _, _, size in self._entries())
+
+    def key(self, content_hash, variant=''):
+        """Cache key for a document's content hash under this analyzer
+
+        variant distinguishes results of the same document produced with
+        different analysis options.
+        """
+        payload = f'{self.fingerprint}:{variant}:{content_hash}'
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.folder, key + '.json')
+
+    def _entries(self):
+        entries = []
+        for entry in os.scandir(self.folder):
+            if entry.name.endswith('.json'):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:  # Evicted by another process
+                    continue
+                entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return entries
+
+    def get(self, key):
+        """Cached value for key, or None"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            os.utime(path)  # Mark as recently used
+            return value
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, value):
+        """Store a JSON-serialisable value under key"""
+        data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        # Write then rename so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.folder, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits in 90% of max_bytes"""
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, _, entry_size in entries)
+        target = self.max_bytes * 0.9
+        for _, path, entry_size in entries:
+            if size <= target:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+        self._size = size
@@ -0,0 +1,160 @@
+import os
+import csv
+
+# Output tables, as <name>.csv or <name>.parquet in the output folder
+CANDIDATES_TABLE = "cv_candidates"
+ITEMS_TABLE = "cv_items"
+
+FORMATS = ('csv', 'parquet')
+
+def _number(value):
+    if not isinstance(value, str):  # Parquet keeps the types
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+class ResultsWriter:
+    """Writes analysis results incrementally as two normalised tables
+
+    The candidates table has one row per candidate: an id, the name, the
+    total score and one column per score section. The items table has one
+    row per extracted item: candidate id, section, position within the
+    section and the item text. Rows are written as candidates are added, so
+    nothing accumulates in memory. Parquet output needs pyarrow and is
+    flushed as a row group every batch_size candidates. candidates_table
+    renames the candidates table, e.g. for rescored copies of it.
+    """
+
+    def __init__(self, folder='.', format='csv', write_items=True, batch_size=1000,
+                 candidates_table=CANDIDATES_TABLE):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown results format: {format}")
+        self.folder = folder
+        self.format = format
+        self.write_items = write_items
+        self.batch_size = batch_size
+        self.candidates_table = candidates_table
+        self.count = 0
+        self._score_columns = None
+        self._candidates = []
+        self._items = []
+        self._files = []
+        self._writers = {}
+
+    def path(self, table):
+        return os.path.join(self.folder, f'{table}.{self.format}')
+
+    def add(self, result, score):
+        """Append one candidate's analysis result and score"""
+        if self._score_columns is None:
+            self._score_columns = list(score['breakdown'])
+        candidate_id = self.count
+        self.count += 1
+
+        self._candidates.append([candidate_id, result['Name'], score['total'],
+                                 *(score['breakdown'][column] for column in self._score_columns)])
+        if self.write_items:
+            for section, items in result.items():
+                if isinstance(items, list):
+                    for position, item in enumerate(items):
+                        self._items.append([candidate_id, section, position, item])
+
+        if self.format == 'csv' or len(self._candidates) >= self.batch_size:
+            self.flush()
+
+    def _columns(self, table):
+        """(name, type) pairs of a table's columns"""
+        if table == ITEMS_TABLE:
+            return [('candidate', 'int'), ('section', 'str'), ('position', 'int'), ('item', 'str')]
+        return [('id', 'int'), ('name', 'str'), ('total', 'float'),
+                *((column, 'float') for column in self._score_columns or ())]
+
+    def flush(self):
+        if self._candidates:
+            self._write(self.candidates_table, self._candidates)
+        if self._items:
+            self._write(ITEMS_TABLE, self._items)
+        self._candidates = []
+        self._items = []
+
+    def _write(self, table, rows):
+        columns = [name for name, _ in self._columns(table)]
+        if self.format == 'csv':
+            writer = self._writers.get(table)
+            if writer is None:
+                f = open(self.path(table), 'w', newline='', encoding='utf-8')
+                self._files.append(f)
+                writer = self._writers[table] = csv.writer(f)
+                writer.writerow(columns)
+            writer.writerows(rows)
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        types = {'int': pa.int64(), 'float': pa.float64(), 'str': pa.string()}
+        schema = pa.schema([(name, types[kind]) for name, kind in self._columns(table)])
+        batch = pa.table({column: [row[i] for row in rows] for i, column in enumerate(columns)},
+                         schema=schema)
+        writer = self._writers.get(table)
+        if writer is None:
+            writer = self._writers[table] = pq.ParquetWriter(self.path(table), batch.schema)
+        writer.write_table(batch)
+
+    def close(self):
+        self.flush()
+        # Tables that got no rows are still written, replacing older output
+        for table in (self.candidates_table, ITEMS_TABLE) if self.write_items else (self.candidates_table,):
+            if table not in self._writers:
+                self._write(table, [])
+        if (not self.write_items and self.candidates_table == CANDIDATES_TABLE
+                and os.path.exists(self.path(ITEMS_TABLE))):
+            # Items from an earlier run would not match the new candidate ids
+            os.remove(self.path(ITEMS_TABLE))
+        for writer in self._writers.values():
+            if hasattr(writer, 'close'):
+                writer.close()
+        for f in self._files:
+            f.close()
+        self._writers = {}
+        self._files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+def _iter_rows(path, format):
+    if format == 'csv':
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+        return
+
+    import pyarrow.parquet as pq
+    for batch in pq.ParquetFile(path).iter_batches():
+        yield from batch.to_pylist()
+
+def read_results(folder='.', format='csv', sections=(), candidates_table=CANDIDATES_TABLE):
+    """Yield (result, score) pairs back from the tables, one candidate at a time
+
+    sections lists the result keys that are present even when empty.
+    """
+    candidates = _iter_rows(os.path.join(folder, f'{candidates_table}.{format}'), format)
+    items_path = os.path.join(folder, f'{ITEMS_TABLE}.{format}')
+    items = _iter_rows(items_path, format) if os.path.exists(items_path) else iter(())
+    pending = next(items, None)
+
+    for row in candidates:
+        candidate_id = _number(row.pop('id'))
+        result = {section: [] for section in sections}
+        # Items were written in candidate order, so they can be merged in one pass
+        while pending is not None and _number(pending['candidate']) == candidate_id:
+            result.setdefault(pending['section'], []).append(pending['item'])
+            pending = next(items, None)
+        result['Name'] = row.pop('name')
+        total = _number(row.pop('total'))
+        score = {'total': total, 'breakdown': {column: _number(value) for column, value in row.items()}}
+        yield result, score
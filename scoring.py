@@ -0,0 +1,89 @@
+import math
+import json
+
+# numpy is only imported by the bulk scoring functions
+
+# Points per item and maximum points for each scored section
+SCORE_RULES = {
+    'experience': (8, 40),   # Most important
+    'education': (7, 35),    # Second most important
+    'skills': (1.5, 15),     # Less weight
+    'languages': (2, 10),    # Same weight
+}
+
+# Named scoring profiles for rescoring stored features; see load_profiles
+PROFILES_FILE = "scoring_profiles.json"
+DEFAULT_PROFILE = "default"
+
+def score_limits(rules=SCORE_RULES):
+    """Number of items after which each scored section earns no more points"""
+    return {section: math.ceil(cap / weight) for section, (weight, cap) in rules.items()}
+
+def calculate_score(analysis, rules=SCORE_RULES):
+    """Calculate a comprehensive score based on the analysis with focus on experience and education"""
+    score = 0
+    breakdown = {}
+    for section, (weight, cap) in rules.items():
+        breakdown[section] = min(len(analysis[section]) * weight, cap)
+        score += breakdown[section]
+
+    return {
+        'total': score,
+        'breakdown': breakdown
+    }
+
+def rule_vectors(rules=SCORE_RULES):
+    """Weights and caps of rules as two arrays, in the order of the rules"""
+    import numpy as np
+    weights, caps = zip(*rules.values())
+    return np.array(weights, dtype=float), np.array(caps, dtype=float)
+
+def count_matrix(analyses, sections=tuple(SCORE_RULES)):
+    """Item counts per candidate (rows) and scored section (columns)"""
+    import numpy as np
+    counts = np.zeros((len(analyses), len(sections)))
+    for row, analysis in enumerate(analyses):
+        counts[row] = [len(analysis[section]) for section in sections]
+    return counts
+
+def score_counts(counts, rules=SCORE_RULES):
+    """Score a whole count matrix at once
+
+    counts has one column per section of rules, in the same order. Returns
+    (totals, breakdown): one total per row and the per-section points, as
+    calculate_score computes them for a single candidate.
+    """
+    import numpy as np
+    weights, caps = rule_vectors(rules)
+    breakdown = np.minimum(np.asarray(counts, dtype=float) * weights, caps)
+    return breakdown.sum(axis=1), breakdown
+
+def score_dicts(totals, breakdown, columns=tuple(SCORE_RULES)):
+    """calculate_score style dicts for the rows of a score_counts result"""
+    return [{'total': float(total), 'breakdown': dict(zip(columns, row.tolist()))}
+            for total, row in zip(totals, breakdown)]
+
+def load_profiles(path=PROFILES_FILE):
+    """Scoring profiles by name: the built-in default plus those defined in path
+
+    The file maps profile names to {"rules": {section: [points per item,
+    max points]}, "keywords": {keyword: points}}; "keywords" is optional.
+    A missing file just leaves the default profile.
+    """
+    profiles = {DEFAULT_PROFILE: {'rules': dict(SCORE_RULES), 'keywords': {}}}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return profiles
+
+    for name, profile in data.items():
+        try:
+            rules = {section: (float(weight), float(cap))
+                     for section, (weight, cap) in profile['rules'].items()}
+            keywords = {keyword: float(points)
+                        for keyword, points in profile.get('keywords', {}).items()}
+        except (KeyError, TypeError, ValueError, AttributeError):
+            raise ValueError(f"Invalid scoring profile '{name}' in {path}")
+        profiles[name] = {'rules': rules, 'keywords': keywords}
+    return profiles
@@ -1,5 +1,10 @@
 import streamlit as st
 import os
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import main as resume_processor
 from pathlib import Path
 
@@ -50,6 +55,64 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# Longer uploads are only analyzed up to this many pages
+MAX_UPLOAD_PAGES = 50
+
+# Worker processes analyzing uploads, shared by all sessions
+UPLOAD_WORKERS = os.cpu_count() or 1
+
+# Analyses kept in memory across reruns and sessions
+UPLOAD_CACHE_ENTRIES = 1000
+
+@st.cache_resource
+def get_pool():
+    """Warm worker pool, started once per server process"""
+    pool = ProcessPoolExecutor(max_workers=UPLOAD_WORKERS, initializer=resume_processor.warm_up)
+    # Keep every worker busy for a moment so that all of them start and warm up now
+    list(pool.map(time.sleep, [0.1] * UPLOAD_WORKERS))
+    return pool
+
+@st.cache_resource
+def get_cache():
+    return resume_processor.open_cache()
+
+class SubmittedUploads:
+    """Futures of the latest upload analyses by (content hash, filename)
+
+    Holds as many uploads as analyze_upload memoizes, so an upload whose
+    memoized result was evicted or cleared gets its finished future back
+    instead of being analyzed again, one at a time.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.futures = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, submit):
+        """Future for key, from submit() unless it is held and has not failed"""
+        with self.lock:
+            future = self.futures.get(key)
+            if future is None or future.cancelled() or (future.done() and future.exception()):
+                future = self.futures[key] = submit()
+            self.futures.move_to_end(key)
+            while len(self.futures) > self.size:
+                self.futures.popitem(last=False)
+            return future
+
+@st.cache_resource
+def submitted_uploads():
+    return SubmittedUploads(UPLOAD_CACHE_ENTRIES)
+
+@st.cache_data(show_spinner=False, max_entries=UPLOAD_CACHE_ENTRIES)
+def analyze_upload(content_hash, filename, _submit):
+    """Analysis and score of an upload, memoized by its content hash and name
+
+    _submit returns the future of the analysis in the worker pool; it is
+    only called on a cache miss.
+    """
+    return _submit().result()
+
 def main():
     st.title("Resume Analyzer Pro")
     
@@ -62,29 +125,27 @@ def main():
     st.markdown('</div>', unsafe_allow_html=True)
 
     if uploaded_files:
-        # Create resumes directory if it doesn't exist
-        os.makedirs("resumes", exist_ok=True)
+        pool = get_pool()
+        cache = get_cache()
+        submitted = submitted_uploads()
+        
+        # Queue every upload not analyzed recently, so they run in parallel;
+        # resumes seen in an earlier server run come from the result cache
+        def submit(uploaded_file):
+            return pool.submit(resume_processor.analyze_file_scored, uploaded_file.getvalue(),
+                               cache, MAX_UPLOAD_PAGES, filename=uploaded_file.name)
+        keys = [(resume_processor.hash_document(uploaded_file), uploaded_file.name)
+                for uploaded_file in uploaded_files]
+        futures = {key: submitted.get(key, partial(submit, uploaded_file))
+                   for key, uploaded_file in zip(keys, uploaded_files)}
         
         # Process each uploaded file
         results = {}
-        for uploaded_file in uploaded_files:
-            # Save the uploaded file
-            file_path = os.path.join("resumes", uploaded_file.name)
-            with open(file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
+        for key, uploaded_file in zip(keys, uploaded_files):
             try:
-                # Extract text from the file
-                if file_path.endswith('.pdf'):
-                    text = resume_processor.extract_text_from_pdf(file_path)
-                else:
-                    text = resume_processor.extract_text_from_docx(file_path)
-                
-                # Analyze the resume
-                analysis = resume_processor.analyze_resume(text)
-                
-                # Calculate score
-                score = resume_processor.calculate_score(analysis)
+                entry = analyze_upload(*key, lambda: futures[key])
+                analysis = entry['analysis']
+                score = entry['score']
                 
                 # Store results
                 results[uploaded_file.name] = {
@@ -95,9 +156,6 @@ def main():
                     'score': score
                 }
                 
-                # Clean up
-                os.remove(file_path)
-                
             except Exception as e:
                 st.error(f"Error processing {uploaded_file.name}: {str(e)}")
                 continue
@@ -0,0 +1,226 @@
+import os
+import time
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import main as resume_processor
+
+class PollingSource:
+    """Finds changed files by comparing size and mtime of a folder's entries every interval"""
+
+    def __init__(self, folder, interval=1.0):
+        self.folder = folder
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self):
+        snapshot = {}
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith('.'):
+                    stat = entry.stat()
+                    snapshot[os.path.join(self.folder, entry.name)] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def changes(self):
+        """Paths added, changed or removed since the last call"""
+        time.sleep(self.interval)
+        snapshot = self.scan()
+        changed = {path for path, signature in snapshot.items()
+                   if self.snapshot.get(path) != signature}
+        changed.update(path for path in self.snapshot if path not in snapshot)
+        self.snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+class WatchdogSource:
+    """Collects the paths of filesystem events (inotify on Linux) in the folder"""
+
+    # Opening and reading a file, as the analysis itself does, changes nothing
+    EVENT_TYPES = {'created', 'modified', 'moved', 'deleted', 'closed'}
+
+    def __init__(self, folder, interval=1.0):
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+
+        self.folder = folder
+        self.interval = interval
+        self.paths = set()
+        self.event = threading.Event()
+        self.lock = threading.Lock()
+        source = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory or event.event_type not in source.EVENT_TYPES:
+                    return
+                for path in (event.src_path, getattr(event, 'dest_path', '')):
+                    name = os.path.basename(path)
+                    if name and not name.startswith('.'):
+                        with source.lock:
+                            source.paths.add(os.path.join(source.folder, name))
+                source.event.set()
+
+        self.observer = Observer()
+        self.observer.schedule(Handler(), folder, recursive=False)
+        self.observer.start()
+
+    def changes(self):
+        """Paths with events since the last call, waiting up to interval for one"""
+        self.event.wait(self.interval)
+        with self.lock:
+            self.event.clear()
+            changed, self.paths = self.paths, set()
+        return changed
+
+    def close(self):
+        self.observer.stop()
+        self.observer.join()
+
+def open_source(folder, interval=1.0, polling=False):
+    """Filesystem events through watchdog when it is installed, otherwise polling"""
+    if not polling:
+        try:
+            return WatchdogSource(folder, interval)
+        except ImportError:
+            print("watchdog is not installed, polling for changes instead")
+    return PollingSource(folder, interval)
+
+def file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+class ResumeWatcher:
+    """Analyzes resumes as they land in a folder and keeps the outputs up to date
+
+    Changed files wait until their size and mtime have not moved for settle
+    seconds, so files that are still being copied are not read half
+    written. Settled files are analyzed in a pool of worker processes and
+    recorded in the incremental manifest (and the result cache); the result
+    tables and report are then rewritten from the manifest, without reading
+    any other document. Files removed from the folder drop out.
+    """
+
+    def __init__(self, folder=resume_processor.RESUME_FOLDER, output_folder='.', workers=1,
+                 settle=2.0, interval=1.0, polling=False, refresh=10.0, use_cache=True,
+                 max_pages=None, score_only=False, segmenter=resume_processor.DEFAULT_SEGMENTER,
+                 results_format='csv', report_page_size=None, top=None):
+        self.folder = folder
+        self.output_folder = output_folder
+        self.workers = max(1, workers)
+        self.settle = settle
+        self.interval = interval
+        self.polling = polling
+        self.refresh = refresh
+        self.options = {'cache': resume_processor.open_cache() if use_cache else None,
+                        'max_pages': max_pages, 'score_only': score_only,
+                        'segmenter': segmenter}
+        self.output_options = {'score_only': score_only, 'results_format': results_format,
+                               'report_page_size': report_page_size, 'top': top}
+        self.manifest = resume_processor.open_manifest(output_folder, max_pages, score_only,
+                                                       segmenter)
+        self.pending = {}   # path -> (signature, time it was last seen changing)
+        self.running = {}   # path -> (future, signature when it was submitted)
+        self.dirty = False
+        self.last_write = 0.0
+
+    def catch_up(self):
+        """Queue the files that changed while the watcher was not running"""
+        file_paths = [path for path in resume_processor.list_resumes(self.folder)
+                      if resume_processor.verify_document(path)]
+        removed = set(self.manifest.entries).difference(file_paths)
+        changed = self.manifest.changed(file_paths)
+        self.dirty = bool(removed)
+        now = time.monotonic()
+        for path in changed:
+            self.pending[path] = (file_signature(path), now - self.settle)
+
+    def notice(self, paths):
+        """Restart the settle timer of changed paths"""
+        now = time.monotonic()
+        for path in paths:
+            self.pending[path] = (file_signature(path), now)
+
+    def settled(self):
+        """Pending paths whose signature has held still for settle seconds"""
+        now = time.monotonic()
+        ready = []
+        for path, (signature, seen) in list(self.pending.items()):
+            current = file_signature(path)
+            if current != signature:
+                self.pending[path] = (current, now)
+            elif now - seen >= self.settle and path not in self.running:
+                del self.pending[path]
+                ready.append(path)
+        return ready
+
+    def submit(self, pool, paths):
+        for path in paths:
+            if file_signature(path) is None:
+                # Removed before it was analyzed
+                if path in self.manifest.entries:
+                    self.manifest.forget(path)
+                    self.dirty = True
+                continue
+            signature = file_signature(path)
+            if not resume_processor.verify_document(path):
+                continue
+            if not self.manifest.is_changed(path):
+                # Touched but not rewritten since it was analyzed
+                continue
+            print(f"Analyzing {os.path.basename(path)}")
+            future = pool.submit(resume_processor.process_resume, path, **self.options)
+            self.running[path] = (future, signature)
+
+    def collect(self):
+        """Record the results of finished files"""
+        for path, (future, signature) in list(self.running.items()):
+            if not future.done():
+                continue
+            del self.running[path]
+            current = file_signature(path)
+            if current is None:
+                self.manifest.forget(path)
+            elif current != signature:
+                # Rewritten while it was analyzed: the result is for the old
+                # content, so analyze the file again once it settles
+                self.pending[path] = (current, time.monotonic())
+                continue
+            else:
+                self.manifest.record(path, future.result())
+            self.dirty = True
+
+    def write_outputs(self):
+        self.manifest.save()
+        file_paths = sorted(self.manifest.entries)
+        resume_processor.write_outputs(self.manifest.results(file_paths), self.output_folder,
+                                       **self.output_options)
+        self.dirty = False
+        self.last_write = time.monotonic()
+
+    def run(self):
+        """Watch until interrupted"""
+        source = open_source(self.folder, self.interval, self.polling)
+        self.catch_up()
+        print(f"Watching {self.folder} (Ctrl+C to stop)")
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                while True:
+                    self.notice(source.changes())
+                    self.submit(pool, self.settled())
+                    self.collect()
+                    # Batch rewrites while a burst of files is being analyzed
+                    if self.dirty and (not self.running
+                                       or time.monotonic() - self.last_write >= self.refresh):
+                        self.write_outputs()
+        except KeyboardInterrupt:
+            print("Stopped watching")
+        finally:
+            source.close()
+            if self.dirty:
+                self.write_outputs()